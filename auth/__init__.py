@@ -1,11 +1,13 @@
 # Auth module
 from .token_manager import token_manager
 from .oauth_client import oauth_client
+from .state_store import state_store
 from .dependencies import get_current_user, get_current_user_optional
 
 __all__ = [
     "token_manager",
     "oauth_client", 
+    "state_store",
     "get_current_user",
     "get_current_user_optional"
 ]
@@ -1,65 +1,53 @@
+from datetime import datetime
 from typing import Optional
-from fastapi import Depends, HTTPException, status, Request
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from auth.token_manager import token_manager
-from crud.user_manager import get_user_by_auth0_id
+
+from auth.verification_cache import peek_user, resolve_user
+from config import settings
+from crud.user_manager import snapshot_user
 from database import get_db
 from models.user import User
-from config import settings
 
-def get_current_user(
+
+def _get_token(request: Request) -> str | None:
+    """
+    Read the access token from the Authorization header, falling back to the cookie.
+    """
+    auth_header = request.headers.get("authorization")
+    if auth_header and auth_header[:7] == "Bearer ":
+        return auth_header[7:]
+    return request.cookies.get("access_token")
+
+
+async def _resolve(db: Session, token: str) -> User:
+    # Cache hits stay on the event loop; only a miss needs a worker thread
+    user = peek_user(db, token)
+    if user is None:
+        user = await run_in_threadpool(resolve_user, db, token)
+    return user
+
+
+async def _get_authenticated_user(
     request: Request,
     db: Session = Depends(get_db),
 ) -> User:
     """
     Dependency to get the current authenticated user from the database.
     """
-    # Check if auth bypass is enabled for testing
-    if settings.bypass_auth:
-        # Return a mock test user for testing
-        from datetime import datetime
-        return User(
-            id="test-user-123",
-            auth0_id="test-user-123",
-            email="test@example.com",
-            name="Test User",
-            picture="https://example.com/avatar.jpg",
-            created_at=datetime.utcnow()
-        )
-    
-    # Try to get token from cookie first, then from Authorization header
-    token = request.cookies.get("access_token")
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-    
+    token = _get_token(request)
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="No authentication token provided",
         )
 
-    payload = token_manager.verify_token(token)
-    auth0_id = payload.get("sub")
-
-    if not auth0_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-        )
-
-    user = get_user_by_auth0_id(db, auth0_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
-
-    return user
+    return await _resolve(db, token)
 
 
-def get_current_user_optional(
+async def _get_authenticated_user_optional(
     request: Request,
     db: Session = Depends(get_db),
 ) -> Optional[User]:
@@ -67,34 +55,38 @@ def get_current_user_optional(
     Optional dependency to get the current user if authenticated.
     Returns None if not authenticated.
     """
-    # Check if auth bypass is enabled for testing
-    if settings.bypass_auth:
-        # Return a mock test user for testing
-        from datetime import datetime
-        return User(
-            id="test-user-123",
-            auth0_id="test-user-123",
-            email="test@example.com",
-            name="Test User",
-            picture="https://example.com/avatar.jpg",
-            created_at=datetime.utcnow()
-        )
-    
-    # Try to get token from cookie first, then from Authorization header
-    token = request.cookies.get("access_token")
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-    
+    token = _get_token(request)
     if not token:
         return None
 
     try:
-        payload = token_manager.verify_token(token)
-        auth0_id = payload.get("sub")
-        if not auth0_id:
-            return None
-        return get_user_by_auth0_id(db, auth0_id)
+        return await _resolve(db, token)
     except HTTPException:
         return None
+
+
+async def _get_mock_user() -> User:
+    """
+    Return a mock test user when auth bypass is enabled for testing.
+    Each request gets its own detached copy, so nothing a handler or session
+    does to it leaks into other requests.
+    """
+    return snapshot_user(_MOCK_USER)
+
+
+# Bind the dependencies once at import so requests never re-check the bypass flag
+if settings.bypass_auth:
+    # Built once; requests get detached copies
+    _MOCK_USER = User(
+        id="test-user-123",
+        auth0_id="test-user-123",
+        email="test@example.com",
+        name="Test User",
+        picture="https://example.com/avatar.jpg",
+        created_at=datetime.utcnow()
+    )
+    get_current_user = _get_mock_user
+    get_current_user_optional = _get_mock_user
+else:
+    get_current_user = _get_authenticated_user
+    get_current_user_optional = _get_authenticated_user_optional
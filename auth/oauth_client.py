@@ -1,8 +1,10 @@
 import httpx
+from cachetools import TTLCache
 from typing import Dict, Any, Optional
 from urllib.parse import urlencode
 import secrets
 from config import settings
+from auth.token_manager import token_cache_key
 
 
 class OAuthClient:
@@ -10,7 +12,29 @@ class OAuthClient:
         self.client_id = settings.oauth_client_id
         self.client_secret = settings.oauth_client_secret
         self.callback_url = settings.oauth_callback_url
-        self.oauth_urls = settings.get_oauth_urls()
+        self.oauth_urls = settings.oauth_urls
+        self._client: Optional[httpx.AsyncClient] = None
+        # Userinfo is stable for an access token's lifetime; keyed by token digest
+        self._userinfo_cache: TTLCache = TTLCache(maxsize=5000, ttl=300)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Shared HTTP client, created on first use so connections to the
+        provider are pooled and kept alive across calls.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     def get_authorization_url(self, state: Optional[str] = None) -> tuple[str, str]:
         """
@@ -43,45 +67,51 @@ class OAuthClient:
             "redirect_uri": self.callback_url,
         }
         
-        async with httpx.AsyncClient() as client:
-            # Get access token
-            token_response = await client.post(
-                self.oauth_urls["token_url"],
-                data=token_data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
-            )
-            
-            if token_response.status_code != 200:
-                raise Exception(f"Token exchange failed: {token_response.text}")
-            
-            tokens = token_response.json()
-            access_token = tokens.get("access_token")
-            
-            if not access_token:
-                raise Exception("No access token received")
-            
-            # Get user info
-            user_info = await self.get_user_info(access_token)
-            
-            return {
-                "tokens": tokens,
-                "user_info": user_info
-            }
+        # Get access token
+        token_response = await self.client.post(
+            self.oauth_urls["token_url"],
+            data=token_data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+        
+        if token_response.status_code != 200:
+            raise Exception(f"Token exchange failed: {token_response.text}")
+        
+        tokens = token_response.json()
+        access_token = tokens.get("access_token")
+        
+        if not access_token:
+            raise Exception("No access token received")
+        
+        # Get user info
+        user_info = await self.get_user_info(access_token)
+        
+        return {
+            "tokens": tokens,
+            "user_info": user_info
+        }
     
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """
         Get user information using the access token.
+        Responses are cached briefly per token so repeat lookups skip the provider.
         """
-        async with httpx.AsyncClient() as client:
-            user_response = await client.get(
-                self.oauth_urls["userinfo_url"],
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            
-            if user_response.status_code != 200:
-                raise Exception(f"Failed to get user info: {user_response.text}")
-            
-            return user_response.json()
+        key = token_cache_key(access_token)
+        cached = self._userinfo_cache.get(key)
+        if cached is not None:
+            return cached
+
+        user_response = await self.client.get(
+            self.oauth_urls["userinfo_url"],
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        
+        if user_response.status_code != 200:
+            raise Exception(f"Failed to get user info: {user_response.text}")
+        
+        user_info = user_response.json()
+        self._userinfo_cache[key] = user_info
+        return user_info
 
 
 oauth_client = OAuthClient()
@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func, insert
+from sqlalchemy.orm import Session
+
+from models.oauth_state import OAuthState
+
+
+class StateStore:
+    """
+    Pending OAuth state values, kept in the database so a callback can be
+    served by any worker. States expire after ttl seconds, abandoned ones
+    are purged as new logins start, and each state can be used once.
+    """
+
+    def __init__(self, ttl: int = 600):
+        self.ttl = timedelta(seconds=ttl)
+
+    def put(self, db: Session, state: str) -> None:
+        db.execute(delete(OAuthState).where(OAuthState.created_at < func.now() - self.ttl))
+        db.execute(insert(OAuthState).values(state=state))
+        db.commit()
+
+    def pop(self, db: Session, state: str) -> bool:
+        """
+        Remove a state, returning whether it was pending. The DELETE is the
+        check, so two callbacks racing with the same state can't both pass.
+        """
+        deleted = db.execute(
+            delete(OAuthState)
+            .where(OAuthState.state == state, OAuthState.created_at >= func.now() - self.ttl)
+            .returning(OAuthState.state)
+        ).first()
+        db.commit()
+        return deleted is not None
+
+
+state_store = StateStore()
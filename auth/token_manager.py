@@ -1,16 +1,76 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+from typing import Any, Dict, Optional
+
+import jwt
+import orjson
 from fastapi import HTTPException, status
+
 from config import settings
 
 
+def token_cache_key(token: str) -> bytes:
+    """
+    Cache key for a token: a 16-byte blake2b digest. Caches keyed this way
+    never hold raw tokens and compare fixed-size keys instead of token strings.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+UserInfo = namedtuple("UserInfo", "user_id email name picture")
+
+
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT decoder that parses the (already verified) payload with orjson."""
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+
 class TokenManager:
+    """
+    Issues and verifies access tokens. Verified payloads are cached under
+    token_cache_key digests; raw tokens are never stored.
+    """
+
     def __init__(self):
         self.secret_key = settings.jwt_secret_key
         self.algorithm = settings.jwt_algorithm
         self.access_token_expire_minutes = settings.jwt_access_token_expire_minutes
-    
+        self._signing_key_bytes = self.secret_key.encode() if self.secret_key else None
+        self._algorithms = [self.algorithm]
+
+        # Per-process cache of verified payloads: key -> (expires_at, payload)
+        self._cache: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._cache_max = 10_000
+        self._cache_ttl = 5
+        self._cache_lock = threading.Lock()
+
+    def _signing_key(self, kid: str | None) -> bytes:
+        """
+        Key used to verify tokens signed with the given key id. Only the static
+        HMAC secret exists today, so kid is ignored; asymmetric keys fetched
+        from a JWKS endpoint would be looked up here.
+        """
+        return self._signing_key_bytes
+
+    def _verification_key(self, token: str) -> bytes:
+        if self.algorithm.startswith("HS"):
+            return self._signing_key(None)
+        return self._signing_key(jwt.get_unverified_header(token).get("kid"))
+
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """Create a new JWT access token"""
         to_encode = data.copy()
@@ -18,31 +78,58 @@ class TokenManager:
             expire = datetime.utcnow() + expires_delta
         else:
             expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-        
+
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        encoded_jwt = jwt.encode(to_encode, self._signing_key_bytes, algorithm=self.algorithm)
         return encoded_jwt
-    
+
     def verify_token(self, token: str) -> Dict[str, Any]:
-        """Verify and decode a JWT token"""
+        """
+        Verify and decode a JWT token.
+        Verified payloads are cached for a few seconds (never past the token's
+        own expiry) so repeat requests skip the decode.
+        """
+        key = token_cache_key(token)
+        now = time.time()
+
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._cache.move_to_end(key)
+                    return entry[1]
+                del self._cache[key]
+
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
-        except JWTError:
+            payload = _jwt.decode(
+                token,
+                self._verification_key(token),
+                algorithms=self._algorithms,
+                options={"require": ["exp"]},
+            )
+        except jwt.PyJWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-    
-    def extract_user_info(self, token_payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract user information from token payload"""
-        return {
-            "user_id": token_payload.get("sub"),
-            "email": token_payload.get("email"),
-            "name": token_payload.get("name"),
-            "picture": token_payload.get("picture"),
-        }
 
+        expires_at = min(payload.get("exp", now), now + self._cache_ttl)
+        with self._cache_lock:
+            self._cache[key] = (expires_at, payload)
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+
+        return payload
+
+    def forget_token(self, token: str) -> None:
+        """Drop a token's cached payload so its next use is verified again."""
+        with self._cache_lock:
+            self._cache.pop(token_cache_key(token), None)
+
+    def extract_user_info(self, token_payload: dict[str, Any]) -> UserInfo:
+        """Extract user information from token payload"""
+        get = token_payload.get
+        return UserInfo(get("sub"), get("email"), get("name"), get("picture"))
 
 token_manager = TokenManager()
@@ -0,0 +1,110 @@
+import threading
+import time
+
+from cachetools import TTLCache
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from auth.token_manager import token_cache_key, token_manager
+from crud.user_manager import get_user_by_auth0_id, snapshot_user
+from models.user import User
+
+# token digest -> (expires_at, detached User snapshot)
+_resolved_users = TTLCache(maxsize=10_000, ttl=5)
+_resolved_users_lock = threading.Lock()
+
+
+class _AuthFail:
+    """Cached rejection for a token that failed verification or user lookup."""
+
+    __slots__ = ("detail", "headers")
+
+    def __init__(self, detail, headers=None):
+        self.detail = detail
+        self.headers = headers
+
+
+# token digest -> _AuthFail; short-lived so a fixed token or new user recovers quickly
+_failed_tokens = TTLCache(maxsize=20_000, ttl=2)
+
+
+def clear_verification_cache():
+    with _resolved_users_lock:
+        _resolved_users.clear()
+        _failed_tokens.clear()
+
+
+def invalidate_token(token: str) -> None:
+    """Forget everything cached for a token, e.g. when the user logs out."""
+    key = token_cache_key(token)
+    with _resolved_users_lock:
+        _resolved_users.pop(key, None)
+        _failed_tokens.pop(key, None)
+    token_manager.forget_token(token)
+
+
+def _reject(key: bytes, detail, headers=None) -> HTTPException:
+    with _resolved_users_lock:
+        _failed_tokens[key] = _AuthFail(detail, headers)
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers=headers,
+    )
+
+
+def peek_user(db: Session, token: str) -> User | None:
+    """
+    Answer from the cache only: the user on a hit, a 401 for a recently
+    rejected token, or None when the token has to be resolved properly.
+    Never touches the database, so it is safe to call on the event loop.
+    """
+    key = token_cache_key(token)
+
+    with _resolved_users_lock:
+        entry = _resolved_users.get(key)
+        failure = _failed_tokens.get(key)
+    if entry is not None and entry[0] > time.time():
+        return db.merge(entry[1], load=False)
+    if failure is not None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=failure.detail,
+            headers=failure.headers,
+        )
+    return None
+
+
+def resolve_user(db: Session, token: str) -> User:
+    """
+    Resolve a bearer token to its user in one step.
+    A hit costs a dict lookup and a no-SELECT merge into the session; a miss
+    verifies the token, loads the user and caches both until the sooner of
+    five seconds or the token's expiry. Failures are remembered for two
+    seconds so repeated bad tokens are rejected without re-verifying.
+    """
+    user = peek_user(db, token)
+    if user is not None:
+        return user
+
+    key = token_cache_key(token)
+    now = time.time()
+
+    try:
+        payload = token_manager.verify_token(token)
+    except HTTPException as e:
+        raise _reject(key, e.detail, e.headers)
+    auth0_id = payload.get("sub")
+
+    if not auth0_id:
+        raise _reject(key, "Invalid authentication credentials")
+
+    user = get_user_by_auth0_id(db, auth0_id)
+    if not user:
+        raise _reject(key, "User not found")
+
+    expires_at = min(payload.get("exp", now), now + 5)
+    with _resolved_users_lock:
+        _resolved_users[key] = (expires_at, snapshot_user(user))
+
+    return user
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from crud.search_manager import search_chunks
+from models.document import Document
 from rag.processing import get_completion
 from rag.reranking import hybrid_search_and_rerank
 from typing import Dict
@@ -23,6 +24,14 @@ def get_chat_response(db: Session, project_id: uuid.UUID, query: str, use_rerank
             "sources": []
         }
     
+    # search_chunks attaches document names; look up any others in one query
+    missing_ids = {chunk.document_id for chunk in chunks if getattr(chunk, "document_name", None) is None}
+    document_names = {}
+    if missing_ids:
+        document_names = dict(
+            db.query(Document.id, Document.name).filter(Document.id.in_(missing_ids)).all()
+        )
+    
     # Prepare context with chunk references
     context_parts = []
     sources = []
@@ -31,9 +40,11 @@ def get_chat_response(db: Session, project_id: uuid.UUID, query: str, use_rerank
         context_parts.append(f"[Source {i+1}]: {chunk.content}")
         
         # Get document name for source attribution
-        from models.document import Document
-        document = db.query(Document).filter(Document.id == chunk.document_id).first()
-        document_name = document.name if document else f"Document {chunk.document_id}"
+        document_name = (
+            getattr(chunk, "document_name", None)
+            or document_names.get(chunk.document_id)
+            or f"Document {chunk.document_id}"
+        )
         
         # Determine relevance score based on available information
         if hasattr(chunk, 'rerank_score'):
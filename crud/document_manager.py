@@ -1,7 +1,11 @@
+import uuid
+
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.orm import Session
+
+from models.chunk import Chunk
 from models.document import Document
 from schemas import DocumentCreate
-import uuid
 
 
 def create_document(db: Session, document: DocumentCreate, project_id: uuid.UUID, content: bytes):
@@ -12,5 +16,60 @@ def create_document(db: Session, document: DocumentCreate, project_id: uuid.UUID
     return db_document
 
 
+def create_chunks(db: Session, document_id: uuid.UUID, contents: list[str], embeddings: list[list[float]]):
+    """
+    Insert a document's chunks in one executemany INSERT, without building
+    an ORM object per chunk.
+    """
+    if not contents:
+        return
+    rows = [
+        {"document_id": document_id, "content": content, "embedding": embeddings[i]}
+        for i, content in enumerate(contents)
+    ]
+    db.execute(insert(Chunk), rows)
+    db.commit()
+
+
 def get_documents_by_project(db: Session, project_id: uuid.UUID):
-    return db.query(Document).filter(Document.project_id == project_id).all()
+    """
+    List a project's documents with their chunk counts in one aggregated
+    query. Only the listing columns are selected, so document content is
+    never loaded.
+    """
+    stmt = (
+        select(
+            Document.id,
+            Document.name,
+            Document.project_id,
+            Document.created_at,
+            func.count(Chunk.id).label("chunk_count"),
+        )
+        .outerjoin(Chunk, Chunk.document_id == Document.id)
+        .where(Document.project_id == project_id)
+        .group_by(Document.id)
+    )
+    return db.execute(stmt).mappings().all()
+
+
+def delete_document(db: Session, project_id: uuid.UUID, document_id: uuid.UUID) -> int | None:
+    """
+    Delete a document in a single statement; its chunks go with it through
+    the ON DELETE CASCADE foreign key. The chunk count is read in the same
+    statement, whose snapshot still sees the chunks. Returns the number of
+    chunks removed, or None if the project has no such document.
+    """
+    deleted = (
+        delete(Document)
+        .where(Document.id == document_id, Document.project_id == project_id)
+        .returning(Document.id)
+        .cte("deleted")
+    )
+    chunk_count = (
+        select(func.count(Chunk.id))
+        .where(Chunk.document_id == deleted.c.id)
+        .scalar_subquery()
+    )
+    chunks_deleted = db.execute(select(chunk_count).select_from(deleted)).scalar()
+    db.commit()
+    return chunks_deleted
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 from models.ingestion_job import IngestionJob
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -41,10 +41,12 @@ def get_ingestion_job(db: Session, job_id: str) -> Optional[IngestionJob]:
 
 def get_jobs_by_user(db: Session, user_id: str, limit: int = 10) -> List[IngestionJob]:
     """
-    Get recent ingestion jobs for a user.
+    Get recent ingestion jobs for a user. The metadata and error columns
+    are deferred since the job list doesn't show them.
     """
     return (
         db.query(IngestionJob)
+        .options(defer(IngestionJob.job_metadata), defer(IngestionJob.error_message))
         .filter(IngestionJob.user_id == user_id)
         .order_by(IngestionJob.created_at.desc())
         .limit(limit)
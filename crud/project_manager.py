@@ -1,8 +1,20 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from cachetools import TTLCache
 from models.project import Project
 from schemas import ProjectCreate
+import threading
 import uuid
 
+# project_id -> owner_id; projects never change owner, so this only bounds memory
+_project_owners = TTLCache(maxsize=4096, ttl=30)
+_project_owners_lock = threading.Lock()
+
+
+def clear_project_cache():
+    with _project_owners_lock:
+        _project_owners.clear()
+
 
 def create_project(db: Session, project: ProjectCreate, owner_id: str):
     db_project = Project(**project.model_dump(), owner_id=owner_id)
@@ -13,8 +25,34 @@ def create_project(db: Session, project: ProjectCreate, owner_id: str):
 
 
 def get_projects_by_owner(db: Session, owner_id: str):
+    """
+    List a user's projects. Not cached: a per-process copy would go stale on
+    the other workers whenever a project is created or deleted.
+    """
     return db.query(Project).filter(Project.owner_id == owner_id).all()
 
 
 def get_project(db: Session, project_id: uuid.UUID):
     return db.query(Project).filter(Project.id == project_id).first()
+
+
+def get_project_owner_id(db: Session, project_id: uuid.UUID):
+    """
+    Owner of a project, or None if it doesn't exist. Selects only the
+    owner_id column and caches hits briefly for per-request ownership checks.
+    """
+    with _project_owners_lock:
+        owner_id = _project_owners.get(project_id)
+    if owner_id is not None:
+        return owner_id
+
+    owner_id = db.scalar(select(Project.owner_id).where(Project.id == project_id))
+    if owner_id is not None:
+        with _project_owners_lock:
+            _project_owners[project_id] = owner_id
+    return owner_id
+
+
+def user_owns_project(db: Session, project_id: uuid.UUID, user_id) -> bool:
+    """Whether the project exists and belongs to user_id."""
+    return get_project_owner_id(db, project_id) == user_id
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from config import settings
 from models.chunk import Chunk
 from rag.processing import get_embeddings
 import uuid
@@ -11,15 +12,30 @@ def search_chunks(db: Session, project_id: uuid.UUID, query: str, top_k: int = 1
     """
     query_embedding = get_embeddings([query])[0]
     
-    # Use native pgvector similarity search with cosine distance
+    # ef_search is the candidate list size of each HNSW pass. It is a
+    # speed/recall knob, not a correctness guarantee: candidates come from
+    # every project and the project filter is applied afterwards.
+    ef_search = max(settings.hnsw_ef_search, top_k)
+    db.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+    # Filtering can leave fewer than top_k rows from a pass, so iterative
+    # scans (pgvector >= 0.8) keep walking the graph until top_k rows match
+    db.execute(text("SET LOCAL hnsw.iterative_scan = relaxed_order"))
+    
+    # Cosine distance on halfvec, matching the HNSW index's operator class.
+    # relaxed_order may return rows slightly out of order, so they are sorted
+    # again once materialized.
     sql_query = text("""
-        SELECT c.id, c.document_id, c.content, c.embedding,
-               c.embedding <=> :query_embedding AS distance
-        FROM chunks c
-        JOIN documents d ON c.document_id = d.id
-        WHERE d.project_id = :project_id
-        ORDER BY distance ASC
-        LIMIT :top_k
+        WITH candidates AS MATERIALIZED (
+            SELECT c.id, c.document_id, c.content,
+                   d.name AS document_name,
+                   c.embedding <=> CAST(:query_embedding AS halfvec(1536)) AS distance
+            FROM chunks c
+            JOIN documents d ON c.document_id = d.id
+            WHERE d.project_id = :project_id
+            ORDER BY distance ASC
+            LIMIT :top_k
+        )
+        SELECT * FROM candidates ORDER BY distance ASC
     """)
     
     result = db.execute(sql_query, {
@@ -33,10 +49,10 @@ def search_chunks(db: Session, project_id: uuid.UUID, query: str, top_k: int = 1
         chunk = Chunk(
             id=row.id,
             document_id=row.document_id,
-            content=row.content,
-            embedding=row.embedding
+            content=row.content
         )
         chunk.distance = row.distance
+        chunk.document_name = row.document_name
         chunks.append(chunk)
     
     return chunks
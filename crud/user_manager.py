@@ -1,6 +1,34 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from cachetools import TTLCache
 from models.user import User
 from schemas import UserCreate, UserUpdate
+import threading
+
+# auth0_id -> detached User snapshot, shared by all sessions in this process
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+_user_cache_lock = threading.Lock()
+
+
+def snapshot_user(user: User) -> User:
+    """
+    Build a detached snapshot of a user that can be merged into any session
+    without a SELECT.
+    """
+    columns = inspect(User).column_attrs
+    snapshot = User(**{attr.key: getattr(user, attr.key) for attr in columns})
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def invalidate_user(auth0_id: str):
+    with _user_cache_lock:
+        _user_cache.pop(auth0_id, None)
+
+
+def clear_user_cache():
+    with _user_cache_lock:
+        _user_cache.clear()
 
 
 def get_user_by_email(db: Session, email: str):
@@ -8,7 +36,17 @@ def get_user_by_email(db: Session, email: str):
 
 
 def get_user_by_auth0_id(db: Session, auth0_id: str):
-    return db.query(User).filter(User.auth0_id == auth0_id).first()
+    with _user_cache_lock:
+        cached = _user_cache.get(auth0_id)
+    if cached is not None:
+        return db.merge(cached, load=False)
+
+    user = db.query(User).filter(User.auth0_id == auth0_id).one_or_none()
+    if user is not None:
+        snapshot = snapshot_user(user)
+        with _user_cache_lock:
+            _user_cache[auth0_id] = snapshot
+    return user
 
 
 def create_user(db: Session, user: UserCreate):
@@ -29,4 +67,5 @@ def update_user(db: Session, user: User, updates: UserUpdate):
         setattr(user, key, value)
     db.commit()
     db.refresh(user)
+    invalidate_user(user.auth0_id)
     return user
@@ -0,0 +1,36 @@
+"""Store embeddings as halfvec with an HNSW index
+
+Revision ID: 5c2e8f1a9d34
+Revises: 003a10cca4c5
+Create Date: 2026-10-16 10:12:31.508214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e8f1a9d34'
+down_revision: Union[str, Sequence[str], None] = '003a10cca4c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # halfvec needs pgvector 0.7+; existing vectors are converted in place
+    op.execute("ALTER TABLE chunks ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536)")
+
+    op.execute(
+        "CREATE INDEX ix_chunks_embedding_hnsw ON chunks "
+        "USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_chunks_embedding_hnsw")
+
+    op.execute("ALTER TABLE chunks ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)")
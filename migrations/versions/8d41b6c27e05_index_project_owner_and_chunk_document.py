@@ -0,0 +1,30 @@
+"""Index projects.owner_id and chunks.document_id
+
+Revision ID: 8d41b6c27e05
+Revises: 5c2e8f1a9d34
+Create Date: 2026-10-16 10:41:07.193862
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41b6c27e05'
+down_revision: Union[str, Sequence[str], None] = '5c2e8f1a9d34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_projects_owner_id'), 'projects', ['owner_id'], unique=False)
+    op.create_index(op.f('ix_chunks_document_id'), 'chunks', ['document_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_chunks_document_id'), table_name='chunks')
+    op.drop_index(op.f('ix_projects_owner_id'), table_name='projects')
@@ -0,0 +1,30 @@
+"""Cascade chunk deletes from documents
+
+Revision ID: e3f7a2b9c614
+Revises: 8d41b6c27e05
+Create Date: 2026-10-16 11:52:30.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3f7a2b9c614'
+down_revision: Union[str, Sequence[str], None] = '8d41b6c27e05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint(op.f('chunks_document_id_fkey'), 'chunks', type_='foreignkey')
+    op.create_foreign_key(op.f('chunks_document_id_fkey'), 'chunks', 'documents', ['document_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(op.f('chunks_document_id_fkey'), 'chunks', type_='foreignkey')
+    op.create_foreign_key(op.f('chunks_document_id_fkey'), 'chunks', 'documents', ['document_id'], ['id'])
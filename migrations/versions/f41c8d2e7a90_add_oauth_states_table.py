@@ -0,0 +1,34 @@
+"""Add oauth_states table
+
+Revision ID: f41c8d2e7a90
+Revises: e3f7a2b9c614
+Create Date: 2026-10-16 14:08:51.326714
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f41c8d2e7a90'
+down_revision: Union[str, Sequence[str], None] = 'e3f7a2b9c614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('oauth_states',
+    sa.Column('state', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('state')
+    )
+    op.create_index(op.f('ix_oauth_states_created_at'), 'oauth_states', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_oauth_states_created_at'), table_name='oauth_states')
+    op.drop_table('oauth_states')
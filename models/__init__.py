@@ -2,4 +2,5 @@ from .user import User as User
 from .project import Project as Project
 from .document import Document as Document
 from .chunk import Chunk as Chunk
-from .ingestion_job import IngestionJob as IngestionJob
\ No newline at end of file
+from .ingestion_job import IngestionJob as IngestionJob
+from .oauth_state import OAuthState as OAuthState
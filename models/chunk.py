@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Text, ForeignKey
+from sqlalchemy import Column, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from pgvector import HalfVector
+from pgvector.sqlalchemy import HALFVEC
 import uuid
 from database import Base
 
@@ -10,11 +11,35 @@ class Chunk(Base):
     __tablename__ = "chunks"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id"), nullable=False)
+    document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
     content = Column(Text, nullable=False)
-    embedding = Column(Vector(1536))
+    # Half-precision storage, searched through an HNSW cosine index
+    embedding = Column(HALFVEC(1536))
     
     document = relationship("Document")
     
+    __table_args__ = (
+        Index(
+            "ix_chunks_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+    )
+    
+    @property
+    def embedding_dimensions(self) -> int:
+        """
+        Length of the stored embedding. Depending on the pgvector version,
+        halfvec columns load as a list or as a HalfVector, which has no len().
+        """
+        embedding = self.embedding
+        if embedding is None:
+            return 0
+        if isinstance(embedding, HalfVector):
+            return embedding.dimensions()
+        return len(embedding)
+    
     def __repr__(self):
         return f"<Chunk {self.id}>"
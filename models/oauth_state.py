@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.sql import func
+
+from database import Base
+
+
+class OAuthState(Base):
+    __tablename__ = "oauth_states"
+    
+    state = Column(String, primary_key=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<OAuthState {self.state}>"
@@ -13,7 +13,7 @@ class Project(Base):
     name = Column(String, nullable=False)
     description = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     owner = relationship("User")
     
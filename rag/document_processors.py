@@ -1,15 +1,24 @@
-import magic
-import PyPDF2
-from docx import Document as DocxDocument
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from typing import Tuple
 
+# PDF, DOCX and libmagic support are imported inside the functions that use
+# them so starting the app doesn't pay for them before the first upload.
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
 
 def detect_file_type(content: bytes, filename: str) -> str:
     """
     Detect file type using python-magic and filename extension.
     """
     try:
+        import magic
         mime_type = magic.from_buffer(content, mime=True)
         
         if mime_type == "application/pdf":
@@ -47,12 +56,11 @@ def extract_text_from_pdf(content: bytes) -> Tuple[str, bool]:
     Returns (text, success)
     """
     try:
+        import PyPDF2
         pdf_file = BytesIO(content)
         pdf_reader = PyPDF2.PdfReader(pdf_file)
         
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        text = "\n".join(page.extract_text() for page in pdf_reader.pages)
         
         return text.strip(), True
     except Exception as e:
@@ -66,12 +74,11 @@ def extract_text_from_docx(content: bytes) -> Tuple[str, bool]:
     Returns (text, success)
     """
     try:
+        from docx import Document as DocxDocument
         docx_file = BytesIO(content)
         doc = DocxDocument(docx_file)
         
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+        text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
         
         return text.strip(), True
     except Exception as e:
@@ -115,4 +122,54 @@ def process_document(content: bytes, filename: str) -> Tuple[str, bool, str]:
     else:
         return "", False, file_type
     
-    return text, success, file_type
\ No newline at end of file
+    return text, success, file_type
+
+
+def process_document_file(path: str) -> tuple[str, bool, str]:
+    """
+    Process a document stored on disk, named after the file.
+    Returns (text, success, file_type)
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    return process_document(content, os.path.basename(path))
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from config import settings
+            # spawn: forking a process that holds DB connections and threads isn't safe
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.extraction_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_extraction_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+async def extract_document(content: bytes, filename: str) -> tuple[str, bool, str]:
+    """
+    Run process_document in a worker process. PDF and DOCX parsing is
+    pure-Python CPU work that holds the GIL, so a thread would still stall
+    the other requests in this worker.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(), process_document, content, filename)
+
+
+async def extract_document_file(path: str) -> tuple[str, bool, str]:
+    """
+    Like extract_document for a staged file. The worker reads the file
+    itself, so only the path crosses the process boundary.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(), process_document_file, path)
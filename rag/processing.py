@@ -1,44 +1,156 @@
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+import asyncio
+import hashlib
+import threading
+from array import array
+from functools import lru_cache
+from typing import List
+
 import requests
+from cachetools import LRUCache
+from fastapi.concurrency import run_in_threadpool
+from requests.adapters import HTTPAdapter
+
 from config import settings
-from typing import List
+
+# One pooled session per process so API calls reuse keep-alive connections
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
+# blake2b(text) -> float32 embedding; values are rounded to half precision when
+# stored in the halfvec column.
+_embedding_cache = LRUCache(maxsize=settings.embedding_cache_size)
+_embedding_cache_lock = threading.Lock()
+
+
+def _embedding_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+def clear_embedding_cache():
+    with _embedding_cache_lock:
+        _embedding_cache.clear()
+
+
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+
+
+@lru_cache(maxsize=1)
+def _text_splitter():
+    """
+    The split function, built once on first use. semantic-text-splitter
+    (Rust) is used when installed; otherwise langchain's recursive splitter,
+    which is imported here because it is the slowest import in the app.
+    Both split on the same character budget.
+    """
+    try:
+        from semantic_text_splitter import TextSplitter
+    except ImportError:
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+        return RecursiveCharacterTextSplitter(
+            chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
+        ).split_text
+    return TextSplitter(CHUNK_SIZE, overlap=CHUNK_OVERLAP).chunks
 
 
 def get_text_chunks(text):
-    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-    chunks = text_splitter.split_text(text)
-    return chunks
+    return _text_splitter()(text)
 
 
 def get_embeddings(texts: List[str]) -> List[List[float]]:
     """
-    Generate embeddings using OpenAI-compatible API via requests.
+    Generate embeddings, reusing cached ones for texts seen before.
+    Only texts missing from the cache are sent to the API, each once.
     """
     if not settings.openai_api_key:
         raise ValueError("OpenAI API key not configured")
-    
+
+    keys = [_embedding_key(text) for text in texts]
+    with _embedding_cache_lock:
+        found = {key: _embedding_cache[key] for key in keys if key in _embedding_cache}
+
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in found:
+            missing.setdefault(key, text)
+
+    if missing:
+        embeddings = _request_embeddings(list(missing.values()))
+        if len(embeddings) != len(missing):
+            raise ValueError(
+                f"Embedding API returned {len(embeddings)} embeddings for {len(missing)} inputs"
+            )
+        fetched = {key: array("f", embedding) for key, embedding in zip(missing, embeddings)}
+        with _embedding_cache_lock:
+            _embedding_cache.update(fetched)
+        found.update(fetched)
+
+    return [found[key].tolist() for key in keys]
+
+
+async def embed_chunks(texts: list[str], batch_size: int = 64, concurrency: int = 8) -> list[list[float]]:
+    """
+    Embed texts in micro-batches sent concurrently from the threadpool, at
+    most `concurrency` requests in flight. Texts are batched in length
+    order so each request carries inputs of similar size; results are
+    returned in input order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+    async def embed_batch(indices: list[int]) -> list[list[float]]:
+        async with semaphore:
+            return await run_in_threadpool(get_embeddings, [texts[i] for i in indices])
+
+    batches = [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+    results = await asyncio.gather(*(embed_batch(indices) for indices in batches))
+
+    embeddings = [None] * len(texts)
+    for indices, batch_embeddings in zip(batches, results):
+        if len(batch_embeddings) != len(indices):
+            raise ValueError(
+                f"Got {len(batch_embeddings)} embeddings for a batch of {len(indices)} texts"
+            )
+        for i, embedding in zip(indices, batch_embeddings):
+            embeddings[i] = embedding
+    return embeddings
+
+
+def _request_embeddings(texts: list[str]) -> list[list[float]]:
+    """
+    Generate embeddings using OpenAI-compatible API via requests.
+    Inputs are sent in batches of at most settings.embedding_batch_size,
+    which must not exceed the API's per-request input limit.
+    """
     headers = {
         "Authorization": f"Bearer {settings.openai_api_key}",
         "Content-Type": "application/json"
     }
     
-    data = {
-        "model": settings.embedding_model,
-        "input": texts
-    }
-    
-    response = requests.post(
-        f"{settings.openai_base_url}/embeddings",
-        headers=headers,
-        json=data,
-        timeout=60
-    )
-    
-    if response.status_code != 200:
-        raise Exception(f"Embedding API error: {response.status_code} - {response.text}")
-    
-    result = response.json()
-    return [item["embedding"] for item in result["data"]]
+    batch_size = settings.embedding_batch_size
+    embeddings = []
+    for start in range(0, len(texts), batch_size):
+        data = {
+            "model": settings.embedding_model,
+            "input": texts[start:start + batch_size]
+        }
+        
+        response = session.post(
+            f"{settings.openai_base_url}/embeddings",
+            headers=headers,
+            json=data,
+            timeout=60
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"Embedding API error: {response.status_code} - {response.text}")
+        
+        result = response.json()
+        embeddings.extend(item["embedding"] for item in result["data"])
+    return embeddings
 
 
 def get_completion(query: str, context: str) -> str:
@@ -71,7 +183,7 @@ def get_completion(query: str, context: str) -> str:
         "max_tokens": 1000
     }
     
-    response = requests.post(
+    response = session.post(
         f"{settings.openai_base_url}/chat/completions",
         headers=headers,
         json=data,
@@ -1,7 +1,23 @@
-import requests
 from config import settings
+from rag.processing import session
 from typing import List
-import json
+import heapq
+import orjson
+
+# System prompt for reranking; identical on every call
+RERANK_SYSTEM_PROMPT = """You are an expert at evaluating the relevance of text passages to search queries.
+Your task is to score each chunk based on how relevant it is to the given query.
+
+Rate each chunk on a scale of 0-10 where:
+- 10: Highly relevant, directly answers the query
+- 7-9: Very relevant, contains important information 
+- 4-6: Somewhat relevant, contains related information
+- 1-3: Slightly relevant, tangentially related
+- 0: Not relevant at all
+
+Return your response as a JSON array of scores in the same order as the chunks.
+Example: [8, 3, 9, 1, 6]
+"""
 
 
 def llm_rerank_chunks(query: str, chunks: List, top_k: int = 10) -> List:
@@ -24,20 +40,6 @@ def llm_rerank_chunks(query: str, chunks: List, top_k: int = 10) -> List:
     for i, chunk in enumerate(chunks):
         chunk_texts.append(f"Chunk {i}: {chunk.content[:500]}")  # Limit chunk size for context
     
-    # Create the reranking prompt
-    system_prompt = """You are an expert at evaluating the relevance of text passages to search queries.
-Your task is to score each chunk based on how relevant it is to the given query.
-
-Rate each chunk on a scale of 0-10 where:
-- 10: Highly relevant, directly answers the query
-- 7-9: Very relevant, contains important information 
-- 4-6: Somewhat relevant, contains related information
-- 1-3: Slightly relevant, tangentially related
-- 0: Not relevant at all
-
-Return your response as a JSON array of scores in the same order as the chunks.
-Example: [8, 3, 9, 1, 6]
-"""
     
     human_prompt = f"""Query: {query}
 
@@ -55,7 +57,7 @@ Please score each chunk's relevance to the query and return only the JSON array
         messages = [
             {
                 "role": "system",
-                "content": system_prompt
+                "content": RERANK_SYSTEM_PROMPT
             },
             {
                 "role": "user",
@@ -70,7 +72,7 @@ Please score each chunk's relevance to the query and return only the JSON array
             "max_tokens": 500
         }
         
-        response = requests.post(
+        response = session.post(
             f"{settings.openai_base_url}/chat/completions",
             headers=headers,
             json=data,
@@ -85,23 +87,20 @@ Please score each chunk's relevance to the query and return only the JSON array
         response_content = result["choices"][0]["message"]["content"]
         
         # Parse the response to get scores
-        scores = json.loads(response_content.strip())
+        scores = orjson.loads(response_content.strip())
         
         # Ensure we have the right number of scores
         if len(scores) != len(chunks):
             # Fallback: return original order if parsing fails
             return chunks[:top_k]
         
-        # Create chunk-score pairs and sort by score
-        chunk_score_pairs = list(zip(chunks, scores))
-        chunk_score_pairs.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top_k chunks
-        reranked_chunks = [chunk for chunk, score in chunk_score_pairs[:top_k]]
+        # Select the top_k highest scores without sorting the rest (ties keep search order)
+        top_indices = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+        reranked_chunks = [chunks[i] for i in top_indices]
         
         # Add the reranking score to chunks for reference
-        for i, (chunk, score) in enumerate(chunk_score_pairs[:top_k]):
-            reranked_chunks[i].rerank_score = score
+        for i, chunk in zip(top_indices, reranked_chunks):
+            chunk.rerank_score = scores[i]
         
         return reranked_chunks
         
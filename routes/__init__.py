@@ -7,6 +7,7 @@ from .search import router as search_router
 from .chat import router as chat_router
 from .jobs import router as jobs_router
 from .documents_upload import router as documents_upload_router
+from .pages import router as pages_router
 
 __all__ = [
     "auth_router",
@@ -17,5 +18,6 @@ __all__ = [
     "search_router",
     "chat_router",
     "jobs_router",
-    "documents_upload_router"
+    "documents_upload_router",
+    "pages_router"
 ]
\ No newline at end of file
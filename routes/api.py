@@ -1,23 +1,28 @@
 from fastapi import APIRouter, Depends
-from auth import get_current_user
+from fastapi.responses import Response
+from auth.dependencies import get_current_user
+import orjson
 
 router = APIRouter(prefix="/api", tags=["api"])
 
+# The public index never changes, so it is serialized once
+API_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to the FastAPI OAuth App!",
+    "status": "public",
+    "endpoints": {
+        "login": "/auth/login",
+        "protected": "/api/protected",
+        "user_info": "/auth/me"
+    }
+})
+
 
 @router.get("/")
 async def root():
     """
     Public endpoint - no authentication required.
     """
-    return {
-        "message": "Welcome to the FastAPI OAuth App!",
-        "status": "public",
-        "endpoints": {
-            "login": "/auth/login",
-            "protected": "/api/protected",
-            "user_info": "/auth/me"
-        }
-    }
+    return Response(content=API_ROOT_BODY, media_type="application/json")
 
 
 @router.get("/protected")
@@ -1,21 +1,29 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
+
+from auth.dependencies import get_current_user
 from auth.oauth_client import oauth_client
+from auth.state_store import state_store
 from auth.token_manager import token_manager
-from crud.user_manager import get_user_by_auth0_id, create_user, update_user
+from config import settings
+from crud.user_manager import create_user, get_user_by_auth0_id, update_user
 from database import get_db
 from schemas import User, UserCreate, UserUpdate
-from auth.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
-# In-memory store for OAuth state (replace with Redis in production)
-_states = {}
+# Cookie attributes are fixed for the process, so the Set-Cookie suffix is built once.
+# Secure is set when the app is served over https, as the OAuth callback URL shows.
+ACCESS_COOKIE_ATTRS = (
+    f"; HttpOnly; Max-Age={settings.jwt_access_token_expire_minutes * 60}; Path=/; SameSite=lax"
+    + ("; Secure" if settings.oauth_callback_url.startswith("https://") else "")
+).encode("latin-1")
 
 
 @router.get("/login")
-async def login():
+async def login(db: Session = Depends(get_db)):
     """
     Initiates the OAuth 2.0 login flow by generating an authorization URL.
     """
@@ -28,7 +36,7 @@ async def login():
             )
         
         auth_url, state = oauth_client.get_authorization_url()
-        _states[state] = True  # Store state to prevent CSRF
+        await run_in_threadpool(state_store.put, db, state)  # Store state to prevent CSRF
         return RedirectResponse(url=auth_url)
     except HTTPException:
         raise
@@ -55,12 +63,11 @@ async def auth_callback(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"OAuth error: {error}",
         )
-    if state not in _states:
+    if not await run_in_threadpool(state_store.pop, db, state):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid state parameter",
         )
-    del _states[state]
 
     try:
         # Exchange authorization code for tokens
@@ -99,14 +106,7 @@ async def auth_callback(
 
         # Set the token in a cookie and redirect to the main page
         response = RedirectResponse(url="/", status_code=302)
-        response.set_cookie(
-            key="access_token",
-            value=access_token,
-            httponly=True,
-            secure=True,
-            samesite="lax",
-            max_age=1800  # 30 minutes
-        )
+        response.raw_headers.append((b"set-cookie", b"access_token=" + access_token.encode() + ACCESS_COOKIE_ATTRS))
         return response
     except Exception as e:
         raise HTTPException(
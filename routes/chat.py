@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from auth.dependencies import get_current_user
 from crud.chat_manager import get_chat_response
-from crud.project_manager import get_project
+from crud.project_manager import user_owns_project
 from database import get_db
 from models.user import User
 from schemas import ChatMessage, ChatResponse
@@ -12,7 +12,7 @@ router = APIRouter(prefix="/projects/{project_id}/chat", tags=["chat"])
 
 
 @router.post("/", response_model=ChatResponse)
-async def chat(
+def chat(
     project_id: uuid.UUID,
     message: ChatMessage,
     db: Session = Depends(get_db),
@@ -20,9 +20,11 @@ async def chat(
 ):
     """
     Chat with a project.
+    Declared sync: the search, rerank and completion calls all block, so
+    FastAPI runs the handler in its threadpool and the event loop stays
+    free for other requests.
     """
-    project = get_project(db, project_id)
-    if not project or project.owner_id != current_user.id:
+    if not user_owns_project(db, project_id, current_user.id):
         raise HTTPException(status_code=404, detail="Project not found")
 
     try:
@@ -1,35 +1,124 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, BackgroundTasks
+import asyncio
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+
 from auth.dependencies import get_current_user
-from crud.document_manager import (
-    create_document as create_document_crud,
-    get_documents_by_project,
-)
-from crud.project_manager import get_project
+from config import settings
+from crud.document_manager import create_chunks, get_documents_by_project
+from crud.document_manager import create_document as create_document_crud
+from crud.document_manager import delete_document as delete_document_crud
 from crud.ingestion_manager import (
+    add_file_error,
     create_ingestion_job,
-    update_job_status,
     increment_job_progress,
-    add_file_error
+    update_job_status,
 )
+from crud.project_manager import user_owns_project
 from database import get_db
 from models.user import User
-from models.document import Document
-from models.chunk import Chunk as ChunkModel
-from schemas import Document as DocumentSchema, DocumentCreate
-from rag.processing import get_text_chunks, get_embeddings
-from rag.document_processors import process_document
+from rag.document_processors import extract_document, extract_document_file
+from rag.processing import embed_chunks, get_text_chunks
+from schemas import Document as DocumentSchema
+from schemas import DocumentCreate, DocumentSummary
 from utils.logging import get_logger, log_document_upload, log_error
-import uuid
-import time
-import os
-import tempfile
-from typing import List
 
 router = APIRouter(prefix="/projects/{project_id}/documents", tags=["documents"])
 logger = get_logger(__name__)
 
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _copy_upload(src, path: str) -> int:
+    with open(path, "wb") as f:
+        shutil.copyfileobj(src, f, UPLOAD_CHUNK_SIZE)
+        return f.tell()
+
+
+async def save_upload(file: UploadFile, path: str) -> int:
+    """
+    Copy an upload to path in 1MB pieces, so a large file is never held in
+    memory whole. The copy runs on a worker thread rather than hopping
+    between the loop and the threadpool for every piece. Returns the number
+    of bytes written.
+    """
+    await file.seek(0)
+    return await run_in_threadpool(_copy_upload, file.file, path)
+
+
+async def stage_uploads(files: list[UploadFile], job_id) -> tuple[tempfile.TemporaryDirectory, list[str]]:
+    """
+    Save a bulk upload into a fresh temporary directory. The caller owns the
+    directory and must clean it up; if staging fails it is removed here.
+    Each file gets its own numbered subdirectory, so uploads sharing a name
+    don't overwrite each other while the staged file keeps the original
+    name. Only the base name is used, so client-supplied paths can't escape
+    the directory.
+    """
+    temp_dir = tempfile.TemporaryDirectory(prefix=f"ingestion_{job_id}_")
+    root = Path(temp_dir.name)
+    file_paths = []
+    try:
+        for i, file in enumerate(files):
+            file_dir = root / str(i)
+            file_dir.mkdir()
+            file_path = str(file_dir / Path(file.filename).name)
+            await save_upload(file, file_path)
+            file_paths.append(file_path)
+    except BaseException:
+        temp_dir.cleanup()
+        raise
+    return temp_dir, file_paths
+
+
+def _insert_chunks(db: Session, document_id, chunks: list[str], embeddings) -> None:
+    try:
+        create_chunks(db, document_id, chunks, embeddings)
+    except Exception:
+        db.rollback()
+        raise
+
+
+async def store_document(db: Session, document: DocumentCreate, project_id, content: bytes, chunks: list[str]):
+    """
+    Create a document and its chunks. The document INSERT and the embedding
+    requests are independent, so they overlap; both are awaited before any
+    failure is handled, so the session is never touched while the insert is
+    still running on its worker thread. If embedding or the chunk insert
+    fails, the new document is deleted again and the error re-raised.
+    """
+    db_document, embeddings = await asyncio.gather(
+        run_in_threadpool(
+            create_document_crud, db=db, document=document, project_id=project_id, content=content
+        ),
+        embed_chunks(chunks),
+        return_exceptions=True,
+    )
+    if isinstance(db_document, BaseException):
+        await run_in_threadpool(db.rollback)
+        raise db_document
+
+    try:
+        if isinstance(embeddings, BaseException):
+            raise embeddings
+        await run_in_threadpool(_insert_chunks, db, db_document.id, chunks, embeddings)
+    except BaseException:
+        try:
+            await run_in_threadpool(delete_document_crud, db, db_document.project_id, db_document.id)
+        except Exception as cleanup_error:
+            log_error(logger, cleanup_error, {"document_id": str(db_document.id)})
+        raise
+    return db_document
+
+
 @router.post("/", response_model=DocumentSchema)
 async def upload_document(
     project_id: uuid.UUID,
@@ -43,15 +132,14 @@ async def upload_document(
     start_time = time.time()
     
     try:
-        project = get_project(db, project_id)
-        if not project or project.owner_id != current_user.id:
+        if not user_owns_project(db, project_id, current_user.id):
             raise HTTPException(status_code=404, detail="Project not found")
 
         content = await file.read()
         file_size = len(content)
         
-        # Process document to extract text
-        text, success, file_type = process_document(content, file.filename)
+        # Extraction is CPU-bound; run it in the extraction process pool
+        text, success, file_type = await extract_document(content, file.filename)
         
         if not success:
             raise HTTPException(
@@ -66,22 +154,9 @@ async def upload_document(
             )
         
         document_create = DocumentCreate(name=file.filename)
-        db_document = create_document_crud(
-            db=db, document=document_create, project_id=project_id, content=content
-        )
+        chunks = await run_in_threadpool(get_text_chunks, text)
 
-        # Process text into chunks and embeddings
-        chunks = get_text_chunks(text)
-        embeddings = get_embeddings(chunks)
-
-        for i, chunk_content in enumerate(chunks):
-            chunk = ChunkModel(
-                document_id=db_document.id,
-                content=chunk_content,
-                embedding=embeddings[i],
-            )
-            db.add(chunk)
-        db.commit()
+        db_document = await store_document(db, document_create, project_id, content, chunks)
         
         # Log successful upload
         processing_time = time.time() - start_time
@@ -110,17 +185,16 @@ async def upload_document(
         raise HTTPException(status_code=500, detail="Internal server error during document processing")
 
 
-@router.get("/", response_model=List[DocumentSchema])
+@router.get("/", response_model=list[DocumentSummary])
 def get_documents(
     project_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Get all documents for a project.
+    Get all documents for a project, with their chunk counts.
     """
-    project = get_project(db, project_id)
-    if not project or project.owner_id != current_user.id:
+    if not user_owns_project(db, project_id, current_user.id):
         raise HTTPException(status_code=404, detail="Project not found")
     return get_documents_by_project(db=db, project_id=project_id)
 
@@ -137,28 +211,13 @@ def delete_document(
     """
     try:
         # Verify project exists and user has access
-        project = get_project(db, project_id)
-        if not project or project.owner_id != current_user.id:
+        if not user_owns_project(db, project_id, current_user.id):
             raise HTTPException(status_code=404, detail="Project not found")
 
-        # Get the document to verify it exists and belongs to the project
-        document = db.query(Document).filter(
-            Document.id == document_id,
-            Document.project_id == project_id
-        ).first()
-
-        if not document:
+        chunks_deleted = delete_document_crud(db, project_id, document_id)
+        if chunks_deleted is None:
             raise HTTPException(status_code=404, detail="Document not found")
 
-        # Delete all chunks associated with this document
-        chunks_deleted = db.query(ChunkModel).filter(
-            ChunkModel.document_id == document_id
-        ).delete()
-
-        # Delete the document
-        db.delete(document)
-        db.commit()
-
         logger.info(f"Deleted document {document_id} and {chunks_deleted} chunks for project {project_id}")
 
         return {
@@ -191,8 +250,7 @@ async def upload_multiple_documents(
     """
     try:
         # Verify project exists and user has access
-        project = get_project(db, project_id)
-        if not project or project.owner_id != current_user.id:
+        if not user_owns_project(db, project_id, current_user.id):
             raise HTTPException(status_code=404, detail="Project not found")
 
         if not files:
@@ -203,13 +261,10 @@ async def upload_multiple_documents(
         total_size = 0
         
         for file in files:
-            content = await file.read()
-            file_size = len(content)
+            # The multipart parser already recorded the size; no need to read the body
+            file_size = file.size
             total_size += file_size
             
-            # Reset file pointer for later processing
-            await file.seek(0)
-            
             file_metadata.append({
                 "filename": file.filename,
                 "size": file_size,
@@ -225,19 +280,8 @@ async def upload_multiple_documents(
             file_metadata=file_metadata
         )
 
-        # Create temporary directory for this job
-        temp_dir = tempfile.mkdtemp(prefix=f"ingestion_{job.id}_")
-        
-        # Save files to temp directory
-        file_paths = []
-        for file in files:
-            file_path = os.path.join(temp_dir, file.filename)
-            content = await file.read()
-            
-            with open(file_path, "wb") as f:
-                f.write(content)
-            
-            file_paths.append(file_path)
+        # Save files to a temporary directory for this job
+        temp_dir, file_paths = await stage_uploads(files, job.id)
 
         # Queue background processing
         background_tasks.add_task(
@@ -274,53 +318,71 @@ async def process_documents_pipeline(
     file_paths: List[str],
     project_id: str,
     user_id: str,
-    temp_dir: str
+    temp_dir: tempfile.TemporaryDirectory
 ):
     """
-    Background task to process multiple documents.
+    Background task to process multiple documents. Removes the staging
+    directory when done.
     """
     from database import SessionLocal
     
     db = SessionLocal()
+    # Job updates commit on the shared session in the threadpool; the lock
+    # keeps two of them from using it at once.
+    db_lock = asyncio.Lock()
+
+    async def update_job(func, *args, **kwargs):
+        async with db_lock:
+            await run_in_threadpool(func, db, *args, **kwargs)
+
     try:
         # Update job status to processing
-        update_job_status(db, job_id, "processing")
+        await update_job(update_job_status, job_id, "processing")
         logger.info(f"Started processing job {job_id} with {len(file_paths)} files")
 
-        for file_path in file_paths:
-            try:
-                filename = os.path.basename(file_path)
-                logger.info(f"Processing file {filename} for job {job_id}")
-                
-                # Process single document
-                await process_single_document_async(
-                    db, file_path, project_id, job_id
-                )
-                
-                # Increment progress (success)
-                increment_job_progress(db, job_id, success=True)
-                logger.info(f"Successfully processed {filename} for job {job_id}")
-
-            except Exception as e:
-                filename = os.path.basename(file_path)
-                error_msg = str(e)
-                
-                # Log file-specific error
-                add_file_error(db, job_id, filename, error_msg)
-                increment_job_progress(db, job_id, success=False)
-                
-                log_error(logger, e, {
-                    "job_id": job_id,
-                    "filename": filename,
-                    "project_id": project_id
-                })
+        # Files are processed concurrently, each with its own session since its
+        # DB work runs in the threadpool.
+        semaphore = asyncio.Semaphore(settings.ingest_concurrency)
+
+        async def process_file(file_path: str):
+            filename = Path(file_path).name
+            async with semaphore:
+                file_db = SessionLocal()
+                try:
+                    logger.info(f"Processing file {filename} for job {job_id}")
+                    
+                    # Process single document
+                    await process_single_document_async(
+                        file_db, file_path, project_id, job_id
+                    )
+                except Exception as e:
+                    error_msg = str(e)
+                    
+                    # Log file-specific error
+                    await update_job(add_file_error, job_id, filename, error_msg)
+                    await update_job(increment_job_progress, job_id, success=False)
+                    
+                    log_error(logger, e, {
+                        "job_id": job_id,
+                        "filename": filename,
+                        "project_id": project_id
+                    })
+                    return
+                finally:
+                    file_db.close()
+
+            # Increment progress (success)
+            await update_job(increment_job_progress, job_id, success=True)
+            logger.info(f"Successfully processed {filename} for job {job_id}")
+
+        await asyncio.gather(*(process_file(file_path) for file_path in file_paths))
 
         # Job completion is handled automatically in increment_job_progress
         logger.info(f"Completed processing job {job_id}")
 
     except Exception as e:
         # Mark entire job as failed
-        update_job_status(db, job_id, "failed", str(e))
+        await update_job(update_job_status, job_id, "failed", str(e))
         log_error(logger, e, {
             "job_id": job_id,
             "project_id": project_id
@@ -328,11 +390,10 @@ async def process_documents_pipeline(
     finally:
         # Clean up temporary files
         try:
-            import shutil
-            shutil.rmtree(temp_dir)
+            temp_dir.cleanup()
             logger.info(f"Cleaned up temp directory for job {job_id}")
         except Exception as e:
-            log_error(logger, e, {"job_id": job_id, "temp_dir": temp_dir})
+            log_error(logger, e, {"job_id": job_id, "temp_dir": temp_dir.name})
         
         db.close()
 
@@ -346,17 +407,12 @@ async def process_single_document_async(
     """
     Process a single document file (async version of existing logic).
     """
-    # Read file content
-    with open(file_path, "rb") as f:
-        content = f.read()
-    
-    filename = os.path.basename(file_path)
-    file_size = len(content)
+    filename = Path(file_path).name
     
     start_time = time.time()
     
-    # Process document to extract text
-    text, success, file_type = process_document(content, filename)
+    # Extraction is CPU-bound; the pool worker reads the staged file by path
+    text, success, file_type = await extract_document_file(file_path)
     
     if not success:
         raise Exception(f"Failed to process file {filename}. Supported formats: PDF, DOCX, TXT, MD")
@@ -364,26 +420,15 @@ async def process_single_document_async(
     if not text.strip():
         raise Exception(f"No text content found in {filename}")
     
-    # Create document record
+    # The original bytes are kept on the document row
+    content = await run_in_threadpool(Path(file_path).read_bytes)
+    file_size = len(content)
+    
     document_create = DocumentCreate(name=filename)
-    db_document = create_document_crud(
-        db=db, document=document_create, project_id=project_id, content=content
-    )
+    chunks = await run_in_threadpool(get_text_chunks, text)
 
-    # Process text into chunks and embeddings
-    chunks = get_text_chunks(text)
-    embeddings = get_embeddings(chunks)
-
-    # Store chunks with metadata
-    for i, chunk_content in enumerate(chunks):
-        chunk = ChunkModel(
-            document_id=db_document.id,
-            content=chunk_content,
-            embedding=embeddings[i],
-        )
-        db.add(chunk)
-    
-    db.commit()
+    # Store the document and its embedded chunks
+    db_document = await store_document(db, document_create, project_id, content, chunks)
     
     # Log successful processing
     processing_time = time.time() - start_time
@@ -1,15 +1,14 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from auth.dependencies import get_current_user
-from crud.project_manager import get_project
+from crud.project_manager import user_owns_project
 from database import get_db
 from models.user import User
-from routes.document import process_documents_pipeline
+from routes.document import process_documents_pipeline, stage_uploads
 from crud.ingestion_manager import create_ingestion_job
 from utils.logging import get_logger, log_error
-import tempfile
-import os
 from typing import List
+import uuid
 
 router = APIRouter(prefix="/documents", tags=["document-upload"])
 logger = get_logger(__name__)
@@ -17,7 +16,7 @@ logger = get_logger(__name__)
 
 @router.post("/upload/{project_id}", status_code=202)
 async def upload_documents_to_project(
-    project_id: str,
+    project_id: uuid.UUID,
     files: List[UploadFile] = File(...),
     background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
@@ -29,8 +28,7 @@ async def upload_documents_to_project(
     """
     try:
         # Verify project exists and user has access
-        project = get_project(db, project_id)
-        if not project or project.owner_id != current_user.id:
+        if not user_owns_project(db, project_id, current_user.id):
             raise HTTPException(status_code=404, detail="Project not found")
 
         if not files:
@@ -41,13 +39,10 @@ async def upload_documents_to_project(
         total_size = 0
         
         for file in files:
-            content = await file.read()
-            file_size = len(content)
+            # The multipart parser already recorded the size; no need to read the body
+            file_size = file.size
             total_size += file_size
             
-            # Reset file pointer for later processing
-            await file.seek(0)
-            
             file_metadata.append({
                 "filename": file.filename,
                 "size": file_size,
@@ -63,19 +58,8 @@ async def upload_documents_to_project(
             file_metadata=file_metadata
         )
 
-        # Create temporary directory for this job
-        temp_dir = tempfile.mkdtemp(prefix=f"ingestion_{job.id}_")
-        
-        # Save files to temp directory
-        file_paths = []
-        for file in files:
-            file_path = os.path.join(temp_dir, file.filename)
-            content = await file.read()
-            
-            with open(file_path, "wb") as f:
-                f.write(content)
-            
-            file_paths.append(file_path)
+        # Save files to a temporary directory for this job
+        temp_dir, file_paths = await stage_uploads(files, job.id)
 
         # Queue background processing
         background_tasks.add_task(
@@ -0,0 +1,256 @@
+import hashlib
+from collections.abc import Sequence
+from string import Template
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from markupsafe import escape
+from sqlalchemy.orm import Session
+
+from auth.dependencies import get_current_user_optional
+from auth.verification_cache import invalidate_token
+from crud.project_manager import get_projects_by_owner
+from database import get_db
+from models.user import User
+
+router = APIRouter(tags=["pages"])
+
+
+def _etag(body: bytes) -> str:
+    # Weak, since GZipMiddleware may change the encoded bytes
+    return 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _html_or_not_modified(request: Request, body: bytes, etag: str, headers: dict) -> Response:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
+
+
+@router.get("/", response_class=HTMLResponse)
+def root(
+    request: Request,
+    current_user = Depends(get_current_user_optional),
+    db: Session = Depends(get_db),
+):
+    """
+    Home page with a modern UI for the RAG application.
+    Declared sync so FastAPI runs the project query in its threadpool
+    instead of blocking the event loop. Answers 304 when the browser
+    already holds the same page.
+    """
+    if current_user is None:
+        return _html_or_not_modified(request, ANON_HOME_PAGE, ANON_HOME_ETAG, ANON_HOME_HEADERS)
+
+    projects = get_projects_by_owner(db, current_user.id)
+    body = get_rag_home_page(current_user, projects)
+    etag = _etag(body)
+    return _html_or_not_modified(request, body, etag, {"ETag": etag, "Cache-Control": "private, no-cache"})
+
+
+@router.get("/login")
+async def login_redirect():
+    """
+    Redirect /login to /auth/login for convenience.
+    """
+    return RedirectResponse(url="/auth/login", status_code=302)
+
+
+@router.get("/logout")
+async def logout_redirect(request: Request):
+    """
+    Clear the session cookie and redirect to the home page.
+    """
+    token = request.cookies.get("access_token")
+    if token:
+        invalidate_token(token)
+    response = RedirectResponse(url="/", status_code=302)
+    response.delete_cookie("access_token")
+    return response
+
+
+# Static shell of the home page, encoded once; only the user section is rendered per request
+HOME_HEADER = b"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>RAG Application</title>
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <style>
+            body {
+                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+                background-color: #f0f2f5;
+                margin: 0;
+                padding: 0;
+                display: flex;
+                justify-content: center;
+                align-items: center;
+                min-height: 100vh;
+            }
+            .container {
+                width: 100%;
+                max-width: 900px;
+                margin: 20px;
+                padding: 40px;
+                background-color: #ffffff;
+                border-radius: 8px;
+                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            }
+            .btn {
+                padding: 10px 20px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+                cursor: pointer;
+                text-decoration: none;
+                display: inline-block;
+            }
+            .btn-primary {
+                background-color: #007bff;
+                color: white;
+            }
+            .btn-danger {
+                background-color: #dc3545;
+                color: white;
+            }
+            .btn-large {
+                padding: 15px 30px;
+                font-size: 18px;
+            }
+            .landing-page {
+                text-align: center;
+            }
+            .dashboard .user-info {
+                display: flex;
+                align-items: center;
+                justify-content: space-between;
+                margin-bottom: 30px;
+            }
+            .dashboard .avatar {
+                width: 50px;
+                height: 50px;
+                border-radius: 50%;
+                margin-right: 15px;
+            }
+            .projects-section, .create-project-form {
+                margin-bottom: 30px;
+            }
+            .project-list {
+                list-style: none;
+                padding: 0;
+            }
+            .project-item {
+                padding: 10px;
+                border-bottom: 1px solid #eeeeee;
+            }
+            .project-link {
+                color: #007bff;
+                text-decoration: none;
+                display: block;
+                padding: 5px;
+                border-radius: 4px;
+                transition: background-color 0.2s;
+            }
+            .project-link:hover {
+                background-color: #f8f9fa;
+                text-decoration: none;
+            }
+            .create-project-form input[type="text"] {
+                width: 100%;
+                padding: 10px;
+                margin-bottom: 10px;
+                border: 1px solid #cccccc;
+                border-radius: 5px;
+            }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            """
+
+HOME_FOOTER = b"""
+        </div>
+    </body>
+    </html>
+    """
+
+
+# Templates for the per-request part of the page, parsed once at import
+PROJECT_ITEM_TEMPLATE = Template(
+    "<li class='project-item'><a href='/projects/$id/dashboard' class='project-link'><strong>$name</strong>: $description</a></li>"
+)
+
+DASHBOARD_TEMPLATE = Template("""
+        <div class="dashboard">
+            <div class="user-info">
+                <img src="$picture" alt="User" class="avatar">
+                <div>
+                    <h2>Welcome, $name!</h2>
+                    <p>$email</p>
+                </div>
+                <a href="/logout" class="btn btn-danger">Logout</a>
+            </div>
+
+            <div class="projects-section">
+                <h3>Your Projects</h3>
+                <ul class="project-list">
+                    $project_list_items
+                </ul>
+            </div>
+
+            <div class="create-project-form">
+                <h3>Create a New Project</h3>
+                <form action="/projects/create" method="post">
+                    <input type="text" name="name" placeholder="Project Name" required>
+                    <input type="text" name="description" placeholder="Project Description" required>
+                    <button type="submit" class="btn btn-primary">Create Project</button>
+                </form>
+            </div>
+        </div>
+        """)
+
+LANDING_SECTION = """
+        <div class="landing-page">
+            <h1>Welcome to the RAG Application</h1>
+            <p>Create knowledge bases from your documents and chat with them.</p>
+            <a href="/login" class="btn btn-primary btn-large">Get Started</a>
+        </div>
+        """
+
+
+def get_rag_home_page(current_user: User | None = None, projects: Sequence = ()) -> bytes:
+    """
+    Generate the home page HTML for the RAG application.
+    User and project fields are HTML-escaped before they are substituted.
+    """
+    if current_user:
+        if projects:
+            project_list_items = "".join(
+                PROJECT_ITEM_TEMPLATE.substitute(
+                    id=project.id, name=escape(project.name), description=escape(project.description or '')
+                )
+                for project in projects
+            )
+        else:
+            project_list_items = "<p>No projects found. Create one below!</p>"
+
+        user_section = DASHBOARD_TEMPLATE.substitute(
+            picture=escape(current_user.picture or ''),
+            name=escape(current_user.name or 'User'),
+            email=escape(current_user.email or ''),
+            project_list_items=project_list_items,
+        )
+    else:
+        user_section = LANDING_SECTION
+
+    return HOME_HEADER + user_section.encode() + HOME_FOOTER
+
+
+# The logged-out page is the same for everyone; render it once
+ANON_HOME_PAGE = get_rag_home_page()
+ANON_HOME_ETAG = _etag(ANON_HOME_PAGE)
+ANON_HOME_HEADERS = {
+    "Cache-Control": "public, max-age=60",
+    "Vary": "Cookie, Authorization",
+    "ETag": ANON_HOME_ETAG,
+}
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, Form, HTTPException
 from fastapi.responses import RedirectResponse, HTMLResponse
+from markupsafe import escape
 from sqlalchemy.orm import Session
 from auth.dependencies import get_current_user
 from crud.project_manager import create_project as create_project_crud, get_projects_by_owner
@@ -118,7 +119,7 @@ def get_project_dashboard_html(project: ProjectModel):
     <!DOCTYPE html>
     <html>
     <head>
-        <title>{project.name} - Dashboard</title>
+        <title>{escape(project.name)} - Dashboard</title>
         <meta name="viewport" content="width=device-width, initial-scale=1">
         <style>
             body {{
@@ -426,8 +427,8 @@ def get_project_dashboard_html(project: ProjectModel):
         <div class="container">
             <div class="header">
                 <div class="project-info">
-                    <h1>{project.name}</h1>
-                    <p>{project.description}</p>
+                    <h1>{escape(project.name)}</h1>
+                    <p>{escape(project.description)}</p>
                 </div>
                 <div class="nav-buttons">
                     <a href="/" class="btn btn-secondary">← Back to Home</a>
@@ -880,7 +881,7 @@ def get_document_chunks_html(project: ProjectModel, document, chunks):
     <!DOCTYPE html>
     <html>
     <head>
-        <title>{document.name} - Chunks</title>
+        <title>{escape(document.name)} - Chunks</title>
         <meta name="viewport" content="width=device-width, initial-scale=1">
         <style>
             body {{
@@ -1031,9 +1032,9 @@ def get_document_chunks_html(project: ProjectModel, document, chunks):
                 <div class="document-info">
                     <h1>
                         <span>📄</span>
-                        {document.name}
+                        {escape(document.name)}
                     </h1>
-                    <p>Document chunks for {project.name}</p>
+                    <p>Document chunks for {escape(project.name)}</p>
                 </div>
                 <div class="nav-buttons">
                     <a href="/projects/{project.id}/dashboard" class="btn btn-secondary">← Back to Dashboard</a>
@@ -1056,7 +1057,7 @@ def get_document_chunks_html(project: ProjectModel, document, chunks):
                         <div class="stat-label">Avg Chunk Size</div>
                     </div>
                     <div class="stat-item">
-                        <div class="stat-value">{len(chunks[0].embedding) if chunks and chunks[0].embedding is not None else 0}</div>
+                        <div class="stat-value">{chunks[0].embedding_dimensions if chunks else 0}</div>
                         <div class="stat-label">Embedding Dims</div>
                     </div>
                 </div>
@@ -1089,9 +1090,9 @@ def get_chunks_html(chunks):
                     {word_count} words • {char_count} characters
                 </span>
             </div>
-            <div class="chunk-content">{chunk.content}</div>
+            <div class="chunk-content">{escape(chunk.content)}</div>
             <div class="chunk-stats">
-                <strong>Embedding:</strong> {len(chunk.embedding) if chunk.embedding is not None else 0} dimensions
+                <strong>Embedding:</strong> {chunk.embedding_dimensions} dimensions
                 {"• <strong>Vector ID:</strong> " + str(chunk.id) if chunk.id else ""}
             </div>
         </div>
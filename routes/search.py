@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from auth.dependencies import get_current_user
 from crud.search_manager import search_chunks
-from crud.project_manager import get_project
+from crud.project_manager import user_owns_project
 from database import get_db
 from models.user import User
 from schemas import SearchQuery, SearchResult
@@ -22,8 +22,7 @@ async def search(
     """
     Search for chunks in a project.
     """
-    project = get_project(db, project_id)
-    if not project or project.owner_id != current_user.id:
+    if not user_owns_project(db, project_id, current_user.id):
         raise HTTPException(status_code=404, detail="Project not found")
 
     return search_chunks(db=db, project_id=project_id, query=query.text)
@@ -50,6 +50,9 @@ class Document(DocumentBase):
     class Config:
         from_attributes = True
 
+class DocumentSummary(Document):
+    chunk_count: int
+
 class SearchQuery(BaseModel):
     text: str
 
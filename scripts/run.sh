@@ -197,7 +197,7 @@ print_status "Press Ctrl+C to stop the server"
 
 # Use uvicorn to start the server
 if command_exists uvicorn; then
-    exec uvicorn main:app --host "$HOST" --port "$PORT" --reload
+    exec uvicorn main:app --host "$HOST" --port "$PORT" --reload --loop uvloop --http httptools --no-access-log
 else
     # Fallback to python if uvicorn command not found
     export APP_HOST="$HOST"
@@ -31,6 +31,31 @@ def setup_test_database():
     Base.metadata.drop_all(bind=test_engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Drop process-level auth caches so rolled-back users don't leak between tests."""
+    from auth.verification_cache import clear_verification_cache
+    from crud.project_manager import clear_project_cache
+    from crud.user_manager import clear_user_cache
+
+    clear_user_cache()
+    clear_project_cache()
+    clear_verification_cache()
+    yield
+    clear_user_cache()
+    clear_project_cache()
+    clear_verification_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    """Drop cached embeddings so each test sees its own mocked API calls."""
+    from rag.processing import clear_embedding_cache
+    clear_embedding_cache()
+    yield
+    clear_embedding_cache()
+
+
 @pytest.fixture
 def db_session():
     """Create a fresh database session for each test."""
@@ -89,4 +89,62 @@ def test_auth_token_validation(client):
     """Test token validation with invalid token."""
     headers = {"Authorization": "Bearer invalid-token"}
     response = client.get("/auth/me", headers=headers)
-    assert response.status_code == 401
\ No newline at end of file
+    assert response.status_code == 401
+
+@pytest.mark.auth
+@pytest.mark.unit
+def test_verify_token_reuses_cached_payload(auth_token):
+    """Repeat verification of the same token is served from the cache."""
+    from auth.token_manager import token_manager
+
+    first = token_manager.verify_token(auth_token)
+    second = token_manager.verify_token(auth_token)
+    assert second is first
+    assert first["sub"] == "test-user-123"
+
+
+@pytest.mark.auth
+@pytest.mark.unit
+def test_rejected_token_is_not_reverified(db_session):
+    """A token that failed verification is rejected from cache on retry."""
+    from fastapi import HTTPException
+
+    from auth.token_manager import token_manager
+    from auth.verification_cache import resolve_user
+
+    with patch.object(token_manager, "verify_token", wraps=token_manager.verify_token) as verify:
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                resolve_user(db_session, "invalid-token")
+            assert exc_info.value.status_code == 401
+    assert verify.call_count == 1
+
+
+@pytest.mark.auth
+def test_oauth_state_is_single_use(db_session):
+    """A stored OAuth state is accepted once and unknown states are rejected."""
+    from auth.state_store import StateStore
+
+    store = StateStore()
+    store.put(db_session, "test-state")
+    assert store.pop(db_session, "test-state") is True
+    assert store.pop(db_session, "test-state") is False
+    assert store.pop(db_session, "unknown-state") is False
+
+
+@pytest.mark.auth
+def test_oauth_state_expires(db_session):
+    """A state older than the TTL is rejected."""
+    from sqlalchemy import update
+
+    from auth.state_store import StateStore
+    from models.oauth_state import OAuthState
+
+    store = StateStore(ttl=600)
+    store.put(db_session, "old-state")
+    db_session.execute(
+        update(OAuthState)
+        .where(OAuthState.state == "old-state")
+        .values(created_at=OAuthState.created_at - store.ttl * 2)
+    )
+    assert store.pop(db_session, "old-state") is False
@@ -276,4 +276,57 @@ def test_chat_error_handling(mock_chat, client, auth_headers, sample_project):
     response = client.post(f"/projects/{sample_project.id}/chat/", json=chat_data, headers=auth_headers)
     
     # Should return 500 on internal error
-    assert response.status_code == 500
\ No newline at end of file
+    assert response.status_code == 500
+
+@pytest.mark.integration
+def test_search_small_project_gets_top_k_through_hnsw(db_session, authenticated_user, sample_project):
+    """A small project still gets top_k chunks when a larger project's chunks crowd the HNSW candidates."""
+    import random
+    from datetime import datetime
+
+    from sqlalchemy import text
+
+    from crud.search_manager import search_chunks
+    from models.chunk import Chunk
+    from models.document import Document
+    from models.project import Project
+
+    rng = random.Random(0)
+    query = [1.0] + [0.0] * 1535
+
+    big_project = Project(
+        id=uuid4(),
+        name="Big Project",
+        description="Project whose chunks are all nearest to the query",
+        owner_id=authenticated_user.id,
+        created_at=datetime.utcnow()
+    )
+    db_session.add(big_project)
+    db_session.commit()
+
+    for project, count, lead in ((big_project, 200, 1.0), (sample_project, 5, 0.0)):
+        document = Document(
+            id=uuid4(),
+            name=f"{project.name}.txt",
+            content=b"content",
+            project_id=project.id,
+            created_at=datetime.utcnow()
+        )
+        db_session.add(document)
+        db_session.commit()
+        for i in range(count):
+            embedding = [rng.uniform(0.01, 0.1) for _ in range(1536)]
+            embedding[0] = lead
+            db_session.add(Chunk(id=uuid4(), document_id=document.id, content=f"chunk {i}", embedding=embedding))
+        db_session.commit()
+
+    # Force the HNSW index so the test doesn't depend on the planner's choice
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+
+    with patch("crud.search_manager.get_embeddings", return_value=[query]):
+        results = search_chunks(db_session, sample_project.id, "query", top_k=5)
+
+    assert len(results) == 5
+    assert all(chunk.document_name == "Chat Test Project.txt" for chunk in results)
+    distances = [chunk.distance for chunk in results]
+    assert distances == sorted(distances)
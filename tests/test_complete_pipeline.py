@@ -149,7 +149,7 @@ def test_document_processing():
     return results
 
 
-@patch('rag.processing.requests.post')
+@patch('rag.processing.session.post')
 def test_full_pipeline(mock_post, user, project, processing_results):
     """Test the complete ingestion pipeline."""
     print("\n🔄 Testing complete ingestion pipeline...")
@@ -225,7 +225,7 @@ def test_full_pipeline(mock_post, user, project, processing_results):
                     if (chunk.content and 
                         len(chunk.content) > 0 and 
                         chunk.embedding and 
-                        len(chunk.embedding) == 1536):
+                        chunk.embedding_dimensions == 1536):
                         valid_chunks += 1
                 
                 successful_documents.append({
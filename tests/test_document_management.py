@@ -196,6 +196,39 @@ def test_delete_document_without_chunks(client, auth_headers, sample_project, db
     assert db_session.query(Document).filter(Document.id == document.id).first() is None
 
 
+@pytest.mark.integration
+def test_delete_document_cascades_only_its_chunks(sample_document_with_chunks, sample_project, db_session):
+    """Deleting a document removes its chunks through the foreign key and leaves other documents' chunks alone."""
+    from datetime import datetime
+
+    from crud.document_manager import delete_document
+    from models.chunk import Chunk
+    from models.document import Document
+
+    document, chunks = sample_document_with_chunks
+    other_document = Document(
+        id=uuid4(),
+        name="other_document.txt",
+        content=b"Other content",
+        project_id=sample_project.id,
+        created_at=datetime.utcnow()
+    )
+    db_session.add(other_document)
+    db_session.commit()
+    db_session.add(Chunk(id=uuid4(), document_id=other_document.id, content="Other chunk", embedding=[0.4] * 1536))
+    db_session.commit()
+
+    # The wrong project deletes nothing
+    assert delete_document(db_session, uuid4(), document.id) is None
+    assert db_session.query(Chunk).filter(Chunk.document_id == document.id).count() == len(chunks)
+
+    assert delete_document(db_session, sample_project.id, document.id) == len(chunks)
+    db_session.expire_all()
+    assert db_session.query(Document).filter(Document.id == document.id).count() == 0
+    assert db_session.query(Chunk).filter(Chunk.document_id == document.id).count() == 0
+    assert db_session.query(Chunk).filter(Chunk.document_id == other_document.id).count() == 1
+
+
 # Document Chunk Viewing Tests
 
 @pytest.mark.api
@@ -370,7 +403,7 @@ def test_list_documents_empty_project(client, auth_headers, sample_project):
 @pytest.mark.api
 def test_list_documents_with_documents(client, auth_headers, sample_document_with_chunks):
     """Test listing documents for project with documents."""
-    document, _ = sample_document_with_chunks
+    document, chunks = sample_document_with_chunks
     
     response = client.get(f"/projects/{document.project_id}/documents/", headers=auth_headers)
     assert response.status_code == 200
@@ -380,6 +413,7 @@ def test_list_documents_with_documents(client, auth_headers, sample_document_wit
     assert data[0]["id"] == str(document.id)
     assert data[0]["name"] == document.name
     assert data[0]["project_id"] == str(document.project_id)
+    assert data[0]["chunk_count"] == len(chunks)
     assert "created_at" in data[0]
 
 
@@ -413,4 +447,26 @@ def test_list_documents_multiple_documents(client, auth_headers, sample_project,
     # Verify all documents are returned
     returned_names = {doc["name"] for doc in data}
     expected_names = {f"document_{i}.txt" for i in range(3)}
-    assert returned_names == expected_names
\ No newline at end of file
+    assert returned_names == expected_names
+
+# Document Upload Tests
+
+@pytest.mark.api
+def test_upload_document_embedding_failure_removes_document(client, auth_headers, sample_project, db_session):
+    """A failed embedding request leaves no half-stored document behind."""
+    from unittest.mock import patch
+
+    from models.document import Document
+
+    async def failing_embed_chunks(texts):
+        raise RuntimeError("embedding service unavailable")
+
+    with patch("routes.document.embed_chunks", failing_embed_chunks):
+        response = client.post(
+            f"/projects/{sample_project.id}/documents/",
+            files={"file": ("notes.txt", b"Some text worth embedding.", "text/plain")},
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 500
+    assert db_session.query(Document).filter(Document.project_id == sample_project.id).count() == 0
@@ -40,4 +40,127 @@ def test_docs_endpoints(client):
     assert response.status_code == 200
     data = response.json()
     assert "openapi" in data
-    assert "info" in data
\ No newline at end of file
+    assert "info" in data
+
+@pytest.mark.unit
+def test_no_duplicate_routes():
+    """Each method and path is registered by exactly one router."""
+    from collections import Counter
+
+    from main import app
+
+    registered = Counter(
+        (method, route.path)
+        for route in app.routes
+        for method in getattr(route, "methods", None) or ()
+    )
+    duplicates = [key for key, count in registered.items() if count > 1]
+    assert duplicates == []
+
+
+@pytest.mark.api
+def test_root_endpoint_answers_304_for_matching_etag(client):
+    """The home page carries an ETag and a matching If-None-Match gets an empty 304."""
+    response = client.get("/")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client.get("/", headers={"If-None-Match": 'W/"stale"'})
+    assert response.status_code == 200
+
+
+def _cors_client(**options):
+    from fastapi.testclient import TestClient
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    from utils.middleware import CORSMiddleware
+
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/", ok, methods=["GET", "POST"])])
+    return TestClient(CORSMiddleware(app, **options))
+
+
+CORS_OPTIONS = {
+    "allow_origins": ("http://allowed.test",),
+    "allow_credentials": True,
+    "allow_methods": ("GET", "POST"),
+    "allow_headers": ("authorization",),
+}
+
+
+@pytest.mark.unit
+def test_cors_preflight_allowed():
+    """A preflight from an allowed origin, method and header is answered by the middleware."""
+    client = _cors_client(**CORS_OPTIONS)
+    response = client.options("/", headers={
+        "Origin": "http://allowed.test",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "Authorization, Content-Type",
+    })
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://allowed.test"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-methods"] == "GET, POST"
+    assert "authorization" in response.headers["access-control-allow-headers"]
+    assert response.headers["vary"] == "Origin"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("headers", [
+    {"Origin": "http://evil.test", "Access-Control-Request-Method": "GET"},
+    {"Origin": "http://allowed.test", "Access-Control-Request-Method": "DELETE"},
+    {"Origin": "http://allowed.test", "Access-Control-Request-Method": "GET",
+     "Access-Control-Request-Headers": "X-Custom"},
+])
+def test_cors_preflight_rejected(headers):
+    """Preflights with a disallowed origin, method or header get a 400 without CORS grants."""
+    client = _cors_client(**CORS_OPTIONS)
+    response = client.options("/", headers=headers)
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+
+
+@pytest.mark.unit
+def test_cors_simple_request_echoes_allowed_origin():
+    """Simple requests from an allowed origin get the origin echoed and Vary: Origin."""
+    client = _cors_client(**CORS_OPTIONS)
+    response = client.get("/", headers={"Origin": "http://allowed.test"})
+    assert response.status_code == 200
+    assert response.text == "ok"
+    assert response.headers["access-control-allow-origin"] == "http://allowed.test"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert "Origin" in response.headers["vary"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("headers", [{}, {"Origin": "http://evil.test"}])
+def test_cors_other_requests_pass_through(headers):
+    """Requests without an Origin, or from a disallowed one, get no CORS headers."""
+    client = _cors_client(**CORS_OPTIONS)
+    response = client.get("/", headers=headers)
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+    assert "access-control-allow-credentials" not in response.headers
+
+
+@pytest.mark.unit
+def test_cors_wildcard_origin():
+    """Without credentials a wildcard origin is answered with *, and with them the origin is echoed."""
+    response = _cors_client(allow_origins=("*",)).get("/", headers={"Origin": "http://any.test"})
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "vary" not in response.headers
+
+    response = _cors_client(allow_origins=("*",), allow_credentials=True).get(
+        "/", headers={"Origin": "http://any.test"}
+    )
+    assert response.headers["access-control-allow-origin"] == "http://any.test"
+    assert response.headers["vary"] == "Origin"
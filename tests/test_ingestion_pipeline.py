@@ -15,7 +15,7 @@ from crud.ingestion_manager import (
     update_job_status,
     increment_job_progress
 )
-from rag.processing import get_text_chunks, get_embeddings, get_completion
+from rag.processing import get_text_chunks, get_embeddings, get_completion, embed_chunks
 from rag.document_processors import process_document
 
 
@@ -185,7 +185,7 @@ class TestTextChunking:
 class TestEmbeddingGeneration:
     """Test embedding generation with mocked OpenAI API."""
     
-    @patch('rag.processing.requests.post')
+    @patch('rag.processing.session.post')
     def test_get_embeddings_success(self, mock_post, mock_openai_responses):
         """Test successful embedding generation."""
         mock_response = MagicMock()
@@ -206,7 +206,50 @@ class TestEmbeddingGeneration:
         assert "embeddings" in call_args[0][0]
         assert call_args[1]["json"]["input"] == texts
     
-    @patch('rag.processing.requests.post')
+    @patch('rag.processing.session.post')
+    def test_get_embeddings_reuses_cached_texts(self, mock_post, mock_openai_responses):
+        """Test that texts embedded once are not sent to the API again."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_openai_responses["embedding"]
+        mock_post.return_value = mock_response
+
+        texts = ["This is test text 1", "This is test text 2", "This is test text 3"]
+        first = get_embeddings(texts)
+        second = get_embeddings(list(reversed(texts)))
+
+        mock_post.assert_called_once()
+        assert second == list(reversed(first))
+
+    @patch('rag.processing.session.post')
+    def test_get_embeddings_short_response_raises(self, mock_post, mock_openai_responses):
+        """Test that fewer embeddings than inputs is an error, not a shorter result."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_openai_responses["embedding"]
+        mock_post.return_value = mock_response
+
+        texts = [f"This is test text {i}" for i in range(4)]
+
+        with pytest.raises(ValueError, match="3 embeddings for 4 inputs"):
+            get_embeddings(texts)
+
+        # Nothing from the bad response was cached
+        assert len(get_embeddings(texts[:3])) == 3
+        assert mock_post.call_count == 2
+
+    @patch('rag.processing.get_embeddings')
+    def test_embed_chunks_short_batch_raises(self, mock_get_embeddings):
+        """Test that a short batch fails embed_chunks instead of dropping later chunks."""
+        import asyncio
+
+        mock_get_embeddings.side_effect = lambda texts: [[0.1] * 1536 for _ in texts[1:]]
+        texts = [f"chunk {i}" * (i + 1) for i in range(5)]
+
+        with pytest.raises(ValueError, match="1 embeddings for a batch of 2 texts"):
+            asyncio.run(embed_chunks(texts, batch_size=2))
+
+    @patch('rag.processing.session.post')
     def test_get_embeddings_api_error(self, mock_post):
         """Test embedding generation with API error."""
         mock_response = MagicMock()
@@ -225,7 +268,7 @@ class TestEmbeddingGeneration:
 class TestChatCompletion:
     """Test chat completion functionality with mocked OpenAI API."""
     
-    @patch('rag.processing.requests.post')
+    @patch('rag.processing.session.post')
     def test_get_completion_success(self, mock_post, mock_openai_responses):
         """Test successful chat completion."""
         mock_response = MagicMock()
@@ -343,7 +386,7 @@ class TestIngestionJobManagement:
 class TestEndToEndIngestion:
     """Test end-to-end ingestion pipeline."""
     
-    @patch('rag.processing.requests.post')
+    @patch('rag.processing.session.post')
     def test_single_document_processing_pipeline(self, mock_post, db_session, test_project, test_user, test_documents, mock_openai_responses):
         """Test complete processing of a single document."""
         # Mock OpenAI API responses
@@ -401,7 +444,7 @@ class TestEndToEndIngestion:
                 assert chunk.content is not None
                 assert len(chunk.content) > 0
                 assert chunk.embedding is not None
-                assert len(chunk.embedding) == 1536  # OpenAI embedding dimension
+                assert chunk.embedding_dimensions == 1536  # OpenAI embedding dimension
             
             # Verify OpenAI API was called
             assert mock_post.called
@@ -410,7 +453,7 @@ class TestEndToEndIngestion:
             # Clean up temp file
             os.unlink(tmp_file_path)
     
-    @patch('rag.processing.requests.post')
+    @patch('rag.processing.session.post')
     def test_multiple_document_processing(self, mock_post, db_session, test_project, test_user, test_documents, mock_openai_responses):
         """Test processing multiple documents."""
         # Mock OpenAI API responses
@@ -485,7 +528,7 @@ class TestEndToEndIngestion:
                     assert chunk.content is not None
                     assert len(chunk.content) > 0
                     assert chunk.embedding is not None
-                    assert len(chunk.embedding) == 1536
+                    assert chunk.embedding_dimensions == 1536
             
             assert total_chunks > len(document_data)  # Should have multiple chunks per document
             
@@ -541,6 +584,31 @@ class TestCleanup:
         print(f"Cleaned up: {deleted_jobs} jobs, {chunks_deleted} chunks, {documents_deleted} documents, {projects_deleted} projects, {users_deleted} users")
 
 
+def test_stage_uploads_keeps_files_with_the_same_name():
+    """Two uploads with the same name are both staged under that name."""
+    import asyncio
+    import io
+    from pathlib import Path
+
+    from fastapi import UploadFile
+
+    from routes.document import stage_uploads
+
+    files = [
+        UploadFile(file=io.BytesIO(b"first"), filename="report.txt"),
+        UploadFile(file=io.BytesIO(b"second"), filename="nested/report.txt"),
+    ]
+    temp_dir, file_paths = asyncio.run(stage_uploads(files, "test-job"))
+    try:
+        assert len(set(file_paths)) == 2
+        assert [Path(p).name for p in file_paths] == ["report.txt", "report.txt"]
+        assert [Path(p).read_bytes() for p in file_paths] == [b"first", b"second"]
+        assert all(Path(p).is_relative_to(temp_dir.name) for p in file_paths)
+    finally:
+        temp_dir.cleanup()
+    assert not os.path.exists(temp_dir.name)
+
+
 def test_temp_directory_cleanup():
     """Test that temporary directories are properly cleaned up."""
     # Create a temporary directory
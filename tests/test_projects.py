@@ -108,4 +108,35 @@ def test_create_project_validation_empty_strings(client, auth_headers):
     """Test creating project with empty name (should fail validation)."""
     invalid_data = {"name": "", "description": "Valid description"}
     response = client.post("/projects/", json=invalid_data, headers=auth_headers)
-    assert response.status_code == 422  # Validation error for empty name
\ No newline at end of file
+    assert response.status_code == 422  # Validation error for empty name
+
+
+@pytest.mark.integration
+def test_project_owner_lookup_is_cached(db_session, authenticated_user):
+    """Ownership checks hit the database once per project; missing projects aren't cached."""
+    from datetime import datetime
+    from unittest.mock import patch
+
+    from crud.project_manager import get_project_owner_id, user_owns_project
+    from models.project import Project
+
+    project = Project(
+        id=uuid4(),
+        name="Cached Project",
+        description="Project for the ownership cache",
+        owner_id=authenticated_user.id,
+        created_at=datetime.utcnow()
+    )
+    db_session.add(project)
+    db_session.commit()
+
+    assert user_owns_project(db_session, project.id, authenticated_user.id)
+    with patch.object(db_session, "scalar", wraps=db_session.scalar) as scalar:
+        assert user_owns_project(db_session, project.id, authenticated_user.id)
+        assert not user_owns_project(db_session, project.id, uuid4())
+        scalar.assert_not_called()
+
+        missing_id = uuid4()
+        assert get_project_owner_id(db_session, missing_id) is None
+        assert get_project_owner_id(db_session, missing_id) is None
+        assert scalar.call_count == 2
@@ -135,7 +135,7 @@ def test_document_processing():
         assert result["text_length"] > 0, f"No text extracted from {result['filename']}"
 
 
-@patch('rag.processing.requests.post')
+@patch('rag.processing.session.post')
 def test_embedding_mock(mock_post):
     """Test that embedding generation would work with mocked API."""
     print("\n🧠 Testing embedding generation (mocked)...")
@@ -108,7 +108,7 @@ class TestUploadedDocuments:
         found_keywords = [kw for kw in turtle_keywords if kw in full_text_lower]
         print(f"   - Found keywords: {found_keywords}")
     
-    @patch('rag.processing.requests.post')
+    @patch('rag.processing.session.post')
     def test_full_pipeline_ai_history(self, mock_post, db_session, test_project, test_user):
         """Test full pipeline with AI_history.pdf."""
         # Mock OpenAI API response
@@ -174,14 +174,14 @@ class TestUploadedDocuments:
                 assert chunk.content is not None
                 assert len(chunk.content) > 0
                 assert chunk.embedding is not None
-                assert len(chunk.embedding) == 1536
-                print(f"   - Chunk {i+1}: {len(chunk.content)} chars, {len(chunk.embedding)} dims")
+                assert chunk.embedding_dimensions == 1536
+                print(f"   - Chunk {i+1}: {len(chunk.content)} chars, {chunk.embedding_dimensions} dims")
             
         finally:
             # Clean up temp file
             os.unlink(tmp_file_path)
     
-    @patch('rag.processing.requests.post')
+    @patch('rag.processing.session.post')
     def test_full_pipeline_turtles_docx(self, mock_post, db_session, test_project, test_user):
         """Test full pipeline with Turtles of New Mexico.docx."""
         # Mock OpenAI API response
@@ -248,13 +248,13 @@ class TestUploadedDocuments:
                 assert chunk.content is not None
                 assert len(chunk.content) > 0
                 assert chunk.embedding is not None
-                assert len(chunk.embedding) == 1536
+                assert chunk.embedding_dimensions == 1536
                 
                 if "turtle" in chunk.content.lower():
                     turtle_mentions += 1
                 
                 if i < 3:  # Print details for first 3 chunks
-                    print(f"   - Chunk {i+1}: {len(chunk.content)} chars, {len(chunk.embedding)} dims")
+                    print(f"   - Chunk {i+1}: {len(chunk.content)} chars, {chunk.embedding_dimensions} dims")
             
             print(f"   - Chunks mentioning 'turtle': {turtle_mentions}")
             
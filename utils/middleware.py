@@ -0,0 +1,212 @@
+import time
+from collections.abc import Iterable
+
+from utils.logging import get_logger, log_error
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+SAFELISTED_HEADERS = ("accept", "accept-language", "content-language", "content-type")
+
+Header = tuple[bytes, bytes]
+
+# Probe and asset paths, logged at DEBUG so they stay quiet in production
+NOISY_PREFIXES = ("/static", "/health")
+
+
+def add_vary_origin(headers: list[Header]) -> None:
+    """Add Origin to an existing Vary header, or append one."""
+    for i, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            headers[i] = (name, value + b", Origin")
+            return
+    headers.append((b"vary", b"Origin"))
+
+
+def is_event_stream(headers: list[Header]) -> bool:
+    # Starlette appends "; charset=utf-8" to text/* media types
+    return any(
+        name == b"content-type" and value.startswith(b"text/event-stream")
+        for name, value in headers
+    )
+
+
+class CORSMiddleware:
+    """
+    Pure ASGI CORS middleware.
+    Requests without an Origin header are passed straight through. Preflights
+    are answered here without calling the app, and simple requests get the
+    allow-origin headers appended to the response start message. Everything
+    that doesn't depend on the request is encoded once at construction.
+    """
+
+    def __init__(
+        self,
+        app,
+        allow_origins: Iterable[str] = (),
+        allow_methods: Iterable[str] = ("GET",),
+        allow_headers: Iterable[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ):
+        self.app = app
+
+        allow_origins = tuple(allow_origins)
+        allow_methods = tuple(allow_methods)
+        allow_headers = tuple(allow_headers)
+
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_methods = frozenset(ALL_METHODS if "*" in allow_methods else allow_methods)
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_headers = frozenset(
+            h.lower() for h in SAFELISTED_HEADERS + allow_headers if h != "*"
+        )
+        # With credentials the origin must be echoed back rather than "*"
+        self.echo_origin = allow_credentials or not self.allow_all_origins
+
+        simple: list[Header] = []
+        if allow_credentials:
+            simple.append((b"access-control-allow-credentials", b"true"))
+        if not self.echo_origin:
+            simple.append((b"access-control-allow-origin", b"*"))
+        self.simple_headers = simple
+        # Complete simple-response headers per configured origin, keyed by raw header bytes
+        self.origin_headers = {
+            origin.encode("latin-1"): simple + [(b"access-control-allow-origin", origin.encode("latin-1"))]
+            for origin in allow_origins
+            if origin != "*"
+        }
+
+        preflight = list(simple)
+        if self.echo_origin:
+            preflight.append((b"vary", b"Origin"))
+        preflight.append((b"access-control-allow-methods", ", ".join(sorted(self.allow_methods)).encode("latin-1")))
+        preflight.append((b"access-control-max-age", str(max_age).encode("latin-1")))
+        if not self.allow_all_headers:
+            preflight.append((b"access-control-allow-headers", ", ".join(sorted(self.allow_headers)).encode("latin-1")))
+        self.preflight_headers = preflight
+
+    def is_allowed_origin(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self.origin_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight(origin, request_method, request_headers, send)
+            return
+
+        extra = self.origin_headers.get(origin)
+        if extra is None:
+            if not self.allow_all_origins:
+                await self.app(scope, receive, send)
+                return
+            extra = self.simple_headers
+            if self.echo_origin:
+                extra = extra + [(b"access-control-allow-origin", origin)]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                if self.echo_origin:
+                    add_vary_origin(headers)
+                headers.extend(extra)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def preflight(self, origin: bytes, request_method: bytes, request_headers, send):
+        allowed = (
+            self.is_allowed_origin(origin)
+            and request_method.decode("latin-1") in self.allow_methods
+        )
+        headers = list(self.preflight_headers)
+        if request_headers is not None:
+            if self.allow_all_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            else:
+                requested = (h.strip().lower() for h in request_headers.decode("latin-1").split(","))
+                allowed = allowed and all(h in self.allow_headers for h in requested if h)
+
+        if allowed:
+            status, body = 200, b"OK"
+            if self.echo_origin:
+                headers.append((b"access-control-allow-origin", origin))
+        else:
+            status, body = 400, b"Disallowed CORS request"
+
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+class RequestLoggingMiddleware:
+    """
+    Pure ASGI request timing and logging.
+    Adds an X-Process-Time header when the response starts and logs the
+    request once it finishes, without BaseHTTPMiddleware's per-request task
+    and body streaming plumbing. Event streams are logged when their
+    headers go out instead, so the duration is time to first byte rather
+    than the lifetime of the stream.
+    """
+
+    def __init__(self, app, logger=None):
+        self.app = app
+        self.logger = logger or get_logger(__name__)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        logged = False
+
+        async def send_with_timing(message):
+            nonlocal status_code, logged
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+                headers = list(message.get("headers", ()))
+                if is_event_stream(headers):
+                    self.log(scope, status_code, process_time)
+                    logged = True
+                headers.append((b"x-process-time", str(process_time).encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except Exception as e:
+            log_error(self.logger, e, {
+                "method": scope["method"],
+                "endpoint": scope["path"],
+                "duration": time.perf_counter() - start_time
+            })
+            raise
+
+        if not logged:
+            self.log(scope, status_code, time.perf_counter() - start_time)
+
+    def log(self, scope, status_code: int, duration: float):
+        path = scope["path"]
+        log = self.logger.debug if path.startswith(NOISY_PREFIXES) else self.logger.info
+        log("%s %s %d %.1fms", scope["method"], path, status_code, duration * 1000)